@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, ttk, messagebox
 import os
-from text_rank import TextRankKeywordExtractor
+from text_rank import TextRankKeywordExtractor, prepare
 
 class TextRankApp:
     def __init__(self, root):
@@ -178,6 +178,8 @@ class TextRankApp:
         messagebox.showerror("Error", message)
 
 def main():
+    # Fetch any missing NLTK data before the first extraction
+    prepare()
     root = tk.Tk()
     app = TextRankApp(root)
     root.mainloop()
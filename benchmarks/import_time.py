@@ -0,0 +1,51 @@
+"""
+Measure cold-start import time of text_rank.
+
+Each statement runs in a fresh interpreter, and the time of an empty
+interpreter start is subtracted. Usage:
+
+    python benchmarks/import_time.py [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = {
+    'import text_rank': 'import text_rank',
+    'from text_rank import TextRankKeywordExtractor': 'from text_rank import TextRankKeywordExtractor',
+    'import text_rank.utils': 'import text_rank.utils',
+    'import nltk (reference)': 'import nltk',
+}
+
+
+def time_statement(statement: str, repeat: int) -> float:
+    """Return the median wall time in seconds of running ``statement`` in a new interpreter"""
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True, env=env)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=7, help='Runs per statement (median is reported)')
+    args = parser.parse_args()
+
+    baseline = time_statement('pass', args.repeat)
+    print(f"{'interpreter start':<50} {baseline * 1000:8.1f} ms")
+    for label, statement in STATEMENTS.items():
+        elapsed = time_statement(statement, args.repeat) - baseline
+        print(f"{label:<50} {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
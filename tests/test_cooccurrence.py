@@ -0,0 +1,43 @@
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from text_rank.cooccurrence import CooccurrenceCounter, count_cooccurrences
+
+
+def nested_loop_counts(ids, window_size):
+    """The original pairwise loop over every window"""
+    counts = defaultdict(int)
+    for i in range(len(ids)):
+        for j in range(i + 1, min(i + window_size, len(ids))):
+            a, b = ids[i], ids[j]
+            counts[(a, b) if a <= b else (b, a)] += 1
+    return dict(counts)
+
+
+def as_dict(rows, cols, weights):
+    return {(u, v): w for u, v, w in zip(rows.tolist(), cols.tolist(), weights.tolist())}
+
+
+@pytest.mark.parametrize('window_size', [2, 5, 10])
+def test_counts_match_nested_loop(window_size):
+    # A small vocabulary makes repeated words and self-pairs common
+    ids = np.random.default_rng(window_size).integers(0, 30, 500)
+    rows, cols, weights = count_cooccurrences(ids, window_size, 30)
+    assert as_dict(rows, cols, weights) == nested_loop_counts(ids.tolist(), window_size)
+
+
+@pytest.mark.parametrize('window_size', [2, 5, 10])
+def test_streamed_counts_match_nested_loop(window_size):
+    words = [f'w{i}' for i in np.random.default_rng(window_size).integers(0, 30, 500)]
+    counter = CooccurrenceCounter(window_size, merge_threshold=16)
+    for start in range(0, len(words), 7):
+        counter.update(words[start:start + 7])
+    ids = [counter.index[word] for word in words]
+    assert as_dict(*counter.edges()) == nested_loop_counts(ids, window_size)
+
+
+def test_short_sequences():
+    assert as_dict(*count_cooccurrences(np.array([4]), 5, 5)) == {}
+    assert as_dict(*count_cooccurrences(np.array([1, 0]), 5, 2)) == {(0, 1): 1}
@@ -0,0 +1,51 @@
+import io
+
+import networkx as nx
+import numpy as np
+
+from text_rank.graph import WordGraph
+from text_rank.graph_io import read_pajek, write_pajek
+
+
+def reference_pajek(graph, network_name=None):
+    """The original writer, which looked every edge endpoint up in the node list"""
+    f = io.StringIO()
+    if network_name is not None:
+        f.write(f"\n*Network {network_name}\n")
+    f.write(f"*Vertices {len(graph.nodes())}\n")
+    for i, node in enumerate(graph.nodes(), 1):
+        f.write(f'{i} "{node}"\n')
+    f.write("*Edges\n")
+    for u, v, data in graph.edges(data=True):
+        f.write(f"{list(graph.nodes()).index(u)+1} {list(graph.nodes()).index(v)+1} {data['weight']}\n")
+    return f.getvalue()
+
+
+def word_graph():
+    rng = np.random.default_rng(0)
+    rows, cols = rng.integers(0, 40, 120), rng.integers(0, 40, 120)
+    return WordGraph.from_edges([f'word{i}' for i in range(40)], rows, cols, rng.integers(1, 9, 120))
+
+
+def test_networkx_export_matches_reference(tmp_path):
+    graph = word_graph().to_networkx()
+    path = tmp_path / 'graph.net'
+    write_pajek(graph, str(path), encoding='utf-8')
+    assert path.read_bytes() == reference_pajek(graph).encode('utf-8')
+
+
+def test_word_graph_export_matches_reference():
+    graph = word_graph()
+    stream = io.StringIO()
+    write_pajek(graph, stream, network_name='doc')
+    assert stream.getvalue() == reference_pajek(graph.to_networkx(), network_name='doc')
+
+
+def test_round_trip(tmp_path):
+    graph = word_graph()
+    path = tmp_path / 'graph.net.gz'
+    write_pajek(graph, str(path))
+    [(name, loaded)] = list(read_pajek(str(path)))
+    assert name is None
+    assert loaded.vocabulary == graph.vocabulary
+    assert nx.utils.graphs_equal(loaded.to_networkx(), graph.to_networkx())
@@ -0,0 +1,106 @@
+import pytest
+
+from text_rank import DocumentFrequencyIndex, IncrementalTextRank, TextRankKeywordExtractor
+
+TEXT = (
+    "Compatibility of systems of linear constraints over the set of natural numbers. "
+    "Criteria of compatibility of a system of linear Diophantine equations, strict inequations, "
+    "and nonstrict inequations are considered. Upper bounds for components of a minimal set of "
+    "solutions and algorithms of construction of minimal generating sets of solutions for all "
+    "types of systems are given. These criteria and the corresponding algorithms for "
+    "constructing a minimal supporting set of solutions can be used in solving all the "
+    "considered types of systems and systems of mixed types."
+)
+
+EDITS = [
+    ('insert', 81, 'Sparse graph resources matter. '),
+    ('insert', 200, ' additional resources'),
+    ('remove', 10, 40),
+    ('append', ' Appended sentence about graph resources.'),
+    ('replace', 0, 12, 'Scheduling'),
+    ('remove', -30, None),
+    ('append', '\n\nA final paragraph on sparse systems.'),
+]
+
+
+def context_free_tag(tokens):
+    """Tag every alphanumeric token as a noun, independently of its neighbours"""
+    return [(token, 'NN' if token.isalnum() else '.') for token in tokens]
+
+
+@pytest.fixture
+def extractor():
+    try:
+        return TextRankKeywordExtractor(tagger=context_free_tag, tol=1e-10, max_iter=1000)
+    except LookupError:
+        pytest.skip("NLTK stopwords are not installed")
+
+
+def apply(session, edit):
+    kind = edit[0]
+    if kind == 'insert':
+        session.insert(edit[1], edit[2])
+    elif kind == 'append':
+        session.append(edit[1])
+    elif kind == 'replace':
+        session.replace(edit[1], edit[2], edit[3])
+    else:
+        start = edit[1] if edit[1] >= 0 else len(session.text) + edit[1]
+        session.remove(start, len(session.text) if edit[2] is None else edit[2])
+
+
+def test_initial_text_matches_full_extraction(extractor):
+    session = IncrementalTextRank(extractor, TEXT)
+    assert session.keywords(10) == pytest.approx(extractor.extract_keywords(TEXT, 10))
+
+
+def test_edits_match_full_extraction(extractor):
+    session = IncrementalTextRank(extractor, TEXT)
+    for edit in EDITS:
+        apply(session, edit)
+        expected = dict(extractor.extract_keywords(session.text))
+        actual = dict(session.keywords())
+        assert actual.keys() == expected.keys()
+        for word, score in expected.items():
+            assert actual[word] == pytest.approx(score, abs=1e-7)
+
+
+def test_sentence_final_word_is_tokenized_as_in_full_text(extractor):
+    # Treebank keeps "numbers." together mid-text, so it is not a candidate there
+    session = IncrementalTextRank(extractor, TEXT)
+    session.insert(20, ' sparse')
+    assert dict(session.keywords()).keys() == dict(extractor.extract_keywords(session.text)).keys()
+
+
+@pytest.mark.parametrize('weighting', ['idf', 'tfidf', 'bm25'])
+def test_edits_are_reweighted_like_full_extraction(weighting):
+    try:
+        extractor = TextRankKeywordExtractor(tagger=context_free_tag, tol=1e-10, max_iter=1000,
+                                             document_frequency=DocumentFrequencyIndex(), weighting=weighting)
+    except LookupError:
+        pytest.skip("NLTK stopwords are not installed")
+    extractor.add_documents([TEXT, "Sparse systems of graph resources.", "Linear graph algorithms."])
+    session = IncrementalTextRank(extractor, TEXT)
+    for edit in EDITS[:3]:
+        apply(session, edit)
+        expected = dict(extractor.extract_keywords(session.text))
+        actual = dict(session.keywords())
+        assert actual.keys() == expected.keys()
+        for word, score in expected.items():
+            assert actual[word] == pytest.approx(score, abs=1e-7)
+
+
+def test_edits_are_pruned_like_full_extraction():
+    try:
+        extractor = TextRankKeywordExtractor(tagger=context_free_tag, tol=1e-10, max_iter=1000,
+                                             min_edge_weight=2, min_count=2)
+    except LookupError:
+        pytest.skip("NLTK stopwords are not installed")
+    session = IncrementalTextRank(extractor, TEXT)
+    for edit in EDITS:
+        apply(session, edit)
+        expected = dict(extractor.extract_keywords(session.text))
+        actual = dict(session.keywords())
+        assert actual.keys() == expected.keys()
+        for word, score in expected.items():
+            assert actual[word] == pytest.approx(score, abs=1e-7)
@@ -0,0 +1,41 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from text_rank.graph import WordGraph
+from text_rank.ranking import rank_networkx, rank_sparse, top_k
+
+
+def random_graph(n_nodes, n_edges, seed):
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, n_nodes, n_edges)
+    cols = rng.integers(0, n_nodes, n_edges)
+    weights = rng.integers(1, 5, n_edges)
+    return WordGraph.from_edges([f'w{i}' for i in range(n_nodes)], rows, cols, weights)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_sparse_scores_match_networkx(seed):
+    # Sparse enough to leave isolated nodes, which networkx treats as dangling
+    graph = random_graph(60, 80, seed)
+    sparse = rank_sparse(graph, tol=1e-12, max_iter=1000)
+    reference = rank_networkx(graph, tol=1e-12, max_iter=1000)
+    assert sparse.scores == pytest.approx(reference.scores, abs=1e-9)
+
+
+def test_sparse_scores_match_networkx_with_self_loops():
+    graph = WordGraph.from_networkx(nx.Graph([('a', 'a', {'weight': 3}), ('a', 'b', {'weight': 1}),
+                                              ('b', 'c', {'weight': 2}), ('c', 'c', {'weight': 1})]))
+    sparse = rank_sparse(graph, damping=0.7, tol=1e-12, max_iter=1000)
+    reference = rank_networkx(graph, damping=0.7, tol=1e-12, max_iter=1000)
+    assert sparse.scores == pytest.approx(reference.scores, abs=1e-9)
+
+
+@pytest.mark.parametrize('top_n', [None, 0, 1, 5, 17, 50, 100])
+def test_top_k_matches_stable_sort(top_n):
+    # Few distinct values, so ties straddle the k-th score
+    scores = np.random.default_rng(1).integers(0, 6, 50).astype(np.float64)
+    expected = np.argsort(-scores, kind='stable')
+    if top_n is not None:
+        expected = expected[:top_n]
+    assert top_k(scores, top_n).tolist() == expected.tolist()
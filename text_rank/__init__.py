@@ -1,24 +1,29 @@
-import nltk
-import os
+from importlib import import_module
 
-def ensure_nltk_data():
-    """Ensure NLTK data is downloaded"""
-    required_data = {
-        'stopwords': 'corpora/stopwords',
-        'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng',
-        'universal_tagset': 'taggers/universal_tagset'
-    }
-    
-    for resource, path in required_data.items():
-        try:
-            nltk.data.find(path)
-        except LookupError:
-            print(f"Downloading {resource}...")
-            nltk.download(resource, quiet=True)
+from .resources import ensure_nltk_data, prepare
 
-# Run the check when the module is imported
-ensure_nltk_data()
+# Public names resolved on first access, so importing the package does not
+# pull in nltk, numpy or scipy
+_LAZY_ATTRIBUTES = {
+    'TextRankKeywordExtractor': '.core',
+    'IncrementalTextRank': '.incremental',
+    'StageCollector': '.instrumentation',
+    'ResultCache': '.result_cache',
+    'Vocabulary': '.vocabulary',
+    'DocumentFrequencyIndex': '.document_frequency',
+    'TextRankSummarizer': '.summarizer',
+    'AsyncTextRank': '.async_api',
+    'ServiceOverloaded': '.async_api',
+}
 
-from .core import TextRankKeywordExtractor
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ['TextRankKeywordExtractor']
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+__all__ = ['TextRankKeywordExtractor', 'TextRankSummarizer', 'IncrementalTextRank', 'AsyncTextRank', 'ServiceOverloaded', 'StageCollector', 'ResultCache', 'Vocabulary', 'DocumentFrequencyIndex', 'prepare', 'ensure_nltk_data']
@@ -0,0 +1,179 @@
+"""
+Asyncio front end that runs extraction on a thread or process pool.
+
+Thread-safety contract of ``TextRankKeywordExtractor``: after construction,
+extraction only reads the extractor's settings, so one instance may serve
+several threads at once as long as nobody changes its attributes meanwhile.
+The mutable helpers it can hold are synchronized: ``CandidateCache``,
+``ResultCache``, ``Vocabulary`` and ``StageCollector`` each guard their state
+with a lock. Custom taggers, ranking backends and observers must be
+thread-safe themselves to be used from a thread pool. Worker processes each
+receive a copy of the extractor instead.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .core import TextRankKeywordExtractor, _extract_keyphrases_task, _extract_keywords_task
+from .parallel import _call_in_worker, _init_worker
+
+EXECUTORS = ('thread', 'process')
+
+
+class ServiceOverloaded(RuntimeError):
+    """Raised when a request would exceed ``max_pending + max_queued`` distinct computations."""
+
+
+class _Flight:
+    """One computation shared by every caller that asked for the same result"""
+
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: 'asyncio.Task'):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncTextRank:
+    """
+    Awaitable keyword extraction for asyncio services.
+
+    Work runs on a thread or process pool, so the event loop is never blocked.
+    At most ``max_pending`` computations are submitted to the pool at a time,
+    and at most ``max_queued`` more wait for a free slot. A request that would
+    start a computation beyond that fails fast with ``ServiceOverloaded``
+    instead of growing an unbounded queue, so callers can shed load (e.g.
+    answer 503). Concurrent requests for the same text and options share one
+    computation, and joining a computation that already exists never fails.
+
+    A request that times out or is cancelled stops waiting immediately. Its
+    computation is cancelled too once no other caller is waiting for it. Work
+    that has already started on the pool cannot be interrupted; it finishes
+    and its result is discarded.
+
+    The thread pool suits an extractor that mostly hits its result cache; for
+    CPU-bound extraction the process pool avoids contention on the GIL. See
+    the module docstring for the thread-safety contract of the extractor.
+
+    Args:
+        extractor: Extractor doing the work. If None, one with default settings is built.
+        executor: 'thread' or 'process'
+        max_workers: Pool size (defaults to the ``concurrent.futures`` default)
+        max_pending: Maximum number of computations submitted to the pool at once
+        timeout: Default per-request timeout in seconds (None waits indefinitely)
+        max_queued: Maximum number of computations waiting for a pool slot
+    """
+
+    def __init__(
+        self,
+        extractor: Optional[TextRankKeywordExtractor] = None,
+        executor: str = 'thread',
+        max_workers: Optional[int] = None,
+        max_pending: int = 64,
+        timeout: Optional[float] = None,
+        max_queued: int = 1024
+    ):
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        if max_queued < 0:
+            raise ValueError("max_queued must be non-negative")
+        self.extractor = extractor if extractor is not None else TextRankKeywordExtractor()
+        self.executor = executor
+        self.max_pending = max_pending
+        self.max_queued = max_queued
+        self.timeout = timeout
+        if executor == 'process':
+            self._pool: Executor = ProcessPoolExecutor(
+                max_workers, initializer=_init_worker, initargs=(self.extractor,)
+            )
+        else:
+            self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix='text_rank')
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[Hashable, _Flight] = {}
+
+    async def extract(self, text: str, top_n: Optional[int] = None, timeout: Optional[float] = None):
+        """
+        Extract keywords without blocking the event loop.
+
+        Args:
+            text: The input text to analyze
+            top_n: Number of top keywords to return. If None, returns all keywords.
+            timeout: Seconds to wait for the result, overriding the default
+
+        Returns:
+            List of tuples containing (word, score) pairs, sorted by score in descending order
+
+        Raises:
+            asyncio.TimeoutError: If the result is not ready within the timeout
+            ServiceOverloaded: If max_pending computations are running and max_queued are waiting
+        """
+        return await self._request(('keywords', text, top_n), _extract_keywords_task, (text, top_n, False), timeout)
+
+    async def extract_keyphrases(
+        self,
+        text: str,
+        top_n: Optional[int] = None,
+        aggregation: str = 'sum',
+        word_ratio: float = 1 / 3,
+        timeout: Optional[float] = None
+    ):
+        """Awaitable ``TextRankKeywordExtractor.extract_keyphrases``"""
+        return await self._request(
+            ('keyphrases', text, top_n, aggregation, word_ratio),
+            _extract_keyphrases_task, (text, top_n, aggregation, word_ratio), timeout
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct computations currently queued or running"""
+        return len(self._in_flight)
+
+    async def _request(self, key: Hashable, func: Callable[[Any, Any], Any], task: Any, timeout: Optional[float]):
+        flight = self._in_flight.get(key)
+        if flight is None:
+            if len(self._in_flight) >= self.max_pending + self.max_queued:
+                raise ServiceOverloaded(f"{len(self._in_flight)} computations are already running or queued")
+            flight = _Flight(asyncio.get_running_loop().create_task(self._execute(func, task)))
+            self._in_flight[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        flight.waiters += 1
+        try:
+            # shield: one caller giving up must not cancel the work for the others
+            return await asyncio.wait_for(asyncio.shield(flight.task), timeout if timeout is not None else self.timeout)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                self._forget(key, flight)
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+    async def _execute(self, func: Callable[[Any, Any], Any], task: Any):
+        if self._slots is None:
+            # Created lazily so it binds to the loop that is actually running
+            self._slots = asyncio.Semaphore(self.max_pending)
+        async with self._slots:
+            if self.executor == 'process':
+                future = self._pool.submit(_call_in_worker, func, False, task)
+            else:
+                future = self._pool.submit(func, self.extractor, task)
+            return await asyncio.wrap_future(future)
+
+    def close(self, wait: bool = True) -> None:
+        """Shut the pool down; queued work that has not started is cancelled"""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def aclose(self) -> None:
+        """Shut the pool down without blocking the event loop"""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self) -> 'AsyncTextRank':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
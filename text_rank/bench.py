@@ -0,0 +1,237 @@
+"""
+Benchmark the extraction pipeline stage by stage over a text corpus.
+
+Run a benchmark and save the results:
+
+    python -m text_rank.bench --windows 2 5 10 --output results.json
+
+Compare two result files and exit with status 1 on regressions:
+
+    python -m text_rank.bench --compare baseline.json results.json --threshold 0.1
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .core import TextRankKeywordExtractor
+from .graph_io import write_pajek
+from .utils import read_text_file
+
+STAGES = ('read', 'tokenize', 'pos_tag', 'filter', 'cooccurrence', 'rank', 'export')
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'text_examples')
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, or None where unsupported"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    values = np.asarray(samples)
+    return {
+        'total': float(values.sum()),
+        'mean': float(values.mean()),
+        'p50': float(np.percentile(values, 50)),
+        'p95': float(np.percentile(values, 95)),
+    }
+
+
+def benchmark_document(extractor: TextRankKeywordExtractor, file_path: str) -> Dict[str, float]:
+    """
+    Run the pipeline on one file, timing each stage separately.
+
+    Returns:
+        Dictionary with the seconds spent in each stage plus token/candidate/node/edge counts
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    text = read_text_file(file_path)
+    timings['read'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tokens = extractor.tokenizer.tokenize(text)
+    timings['tokenize'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pos_tagged = extractor.tagger.tag(tokens)
+    timings['pos_tag'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    words = [word.lower() for word, tag in pos_tagged if extractor._is_candidate(word, tag)]
+    timings['filter'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph = extractor._count_cooccurrences(words)
+    timings['cooccurrence'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extractor._rank_keywords(graph, None)
+    timings['rank'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    write_pajek(graph, io.StringIO())
+    timings['export'] = time.perf_counter() - start
+
+    timings.update(tokens=len(tokens), candidates=len(words),
+                   nodes=graph.number_of_nodes(), edges=graph.number_of_edges())
+    return timings
+
+
+def run_benchmark(
+    file_paths: List[str],
+    window_sizes: List[int],
+    repeat: int = 1,
+    **extractor_options
+) -> Dict[str, object]:
+    """
+    Benchmark every file at every window size.
+
+    Args:
+        file_paths: Corpus files
+        window_sizes: Window sizes to benchmark
+        repeat: Passes over the corpus per window size (all passes are recorded)
+        **extractor_options: Extra ``TextRankKeywordExtractor`` arguments
+
+    Returns:
+        JSON-serializable results keyed by window size
+    """
+    runs = {}
+    for window_size in window_sizes:
+        extractor = TextRankKeywordExtractor(window_size=window_size, **extractor_options)
+        documents = [benchmark_document(extractor, path) for _ in range(repeat) for path in file_paths]
+
+        latencies = [sum(doc[stage] for stage in STAGES) for doc in documents]
+        elapsed = sum(latencies)
+        tokens = sum(doc['tokens'] for doc in documents)
+        runs[str(window_size)] = {
+            'documents': len(documents),
+            'tokens': tokens,
+            'seconds': elapsed,
+            'docs_per_sec': len(documents) / elapsed if elapsed else 0.0,
+            'tokens_per_sec': tokens / elapsed if elapsed else 0.0,
+            'latency': _summary(latencies),
+            'stages': {stage: _summary([doc[stage] for doc in documents]) for stage in STAGES},
+        }
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'files': len(file_paths),
+            'repeat': repeat,
+            'extractor_options': extractor_options,
+            # ru_maxrss only ever grows, so it is one figure for the whole process, not per window size
+            'process_peak_rss_bytes': peak_rss_bytes(),
+        },
+        'runs': runs,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.1, min_delta: float = 0.0005) -> List[str]:
+    """
+    List regressions of ``current`` against ``baseline``.
+
+    Latencies (overall and per-stage p50/p95) regress when they grow by more
+    than ``threshold`` and by at least ``min_delta`` seconds, which keeps
+    timer noise in sub-millisecond stages out of the report. Throughput
+    regresses when it drops by more than ``threshold``.
+    """
+    regressions = []
+    for window, base_run in baseline['runs'].items():
+        run = current['runs'].get(window)
+        if run is None:
+            continue
+        for metric in ('docs_per_sec', 'tokens_per_sec'):
+            if run[metric] < base_run[metric] * (1 - threshold):
+                regressions.append(
+                    f"window={window} {metric}: {base_run[metric]:.1f} -> {run[metric]:.1f}"
+                )
+        checks = [('latency', base_run['latency'], run['latency'])]
+        checks += [(f"stage {stage}", base_run['stages'][stage], run['stages'][stage])
+                   for stage in STAGES if stage in base_run['stages'] and stage in run['stages']]
+        for label, base, new in checks:
+            for quantile in ('p50', 'p95'):
+                if new[quantile] > base[quantile] * (1 + threshold) and new[quantile] - base[quantile] >= min_delta:
+                    regressions.append(
+                        f"window={window} {label} {quantile}: "
+                        f"{base[quantile] * 1000:.2f} ms -> {new[quantile] * 1000:.2f} ms"
+                    )
+    return regressions
+
+
+def _print_results(results: dict) -> None:
+    for window, run in results['runs'].items():
+        print(f"window_size={window}: {run['documents']} docs, {run['docs_per_sec']:.1f} docs/s, "
+              f"{run['tokens_per_sec']:.0f} tokens/s, p50 {run['latency']['p50'] * 1000:.1f} ms, "
+              f"p95 {run['latency']['p95'] * 1000:.1f} ms")
+        for stage, summary in run['stages'].items():
+            print(f"  {stage:<13} total {summary['total']:8.3f} s   "
+                  f"p50 {summary['p50'] * 1000:8.2f} ms   p95 {summary['p95'] * 1000:8.2f} ms")
+    rss = results['meta'].get('process_peak_rss_bytes')
+    if rss:
+        print(f"peak RSS of the whole process: {rss / 2 ** 20:.0f} MiB")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m text_rank.bench',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS, help='Directory of text files (default: data/text_examples)')
+    parser.add_argument('--windows', type=int, nargs='+', default=[2, 5, 10], help='Window sizes to benchmark')
+    parser.add_argument('--limit', type=int, help='Only use the first N files')
+    parser.add_argument('--repeat', type=int, default=1, help='Passes over the corpus per window size')
+    parser.add_argument('--ranking', default='sparse', help="Ranking backend ('sparse' or 'networkx')")
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help='Compare two result files')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Relative change counted as a regression')
+    parser.add_argument('--min-delta-ms', type=float, default=0.5,
+                        help='Smallest latency increase (ms) counted as a regression')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        regressions = compare_results(baseline, current, args.threshold, args.min_delta_ms / 1000)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if not regressions:
+            print(f"No regressions beyond {args.threshold:.0%}")
+        return 1 if regressions else 0
+
+    if not os.path.isdir(args.corpus):
+        parser.error(f"corpus directory not found: {args.corpus}")
+    file_paths = sorted(os.path.join(args.corpus, name) for name in os.listdir(args.corpus))
+    file_paths = [path for path in file_paths if os.path.isfile(path)][:args.limit]
+
+    results = run_benchmark(file_paths, args.windows, repeat=args.repeat, ranking=args.ranking)
+    results['meta']['corpus'] = os.path.abspath(args.corpus)
+    _print_results(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
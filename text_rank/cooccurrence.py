@@ -0,0 +1,178 @@
+"""Vectorized co-occurrence counting over integer-encoded word sequences."""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+def encode_words(words: Iterable[str]) -> Tuple[List[str], np.ndarray]:
+    """
+    Assign integer ids to words in order of first occurrence.
+
+    Args:
+        words: Sequence of candidate words
+
+    Returns:
+        Tuple of (vocabulary, ids) where ``vocabulary[ids[i]]`` is the i-th word
+    """
+    index: Dict[str, int] = {}
+    ids = np.fromiter((index.setdefault(word, len(index)) for word in words), dtype=np.int64)
+    return list(index), ids
+
+
+def count_cooccurrences(
+    ids,
+    window_size: int,
+    n_nodes: int = None,
+    start: int = 0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count how often each pair of ids appears within ``window_size`` positions.
+
+    Each word is paired with the next ``window_size - 1`` words. Every window
+    distance is handled as one shifted-array comparison, and the pair keys
+    of all distances are reduced together with a single ``np.unique``.
+
+    Args:
+        ids: Integer-encoded word sequence
+        window_size: Size of the sliding window
+        n_nodes: Number of distinct ids (defaults to ``max(ids) + 1``)
+        start: Only count pairs whose second word is at position ``start`` or later.
+            Used to extend counts when new words are appended after a context tail.
+
+    Returns:
+        Tuple of (rows, cols, weights) sorted by (row, col), with ``rows <= cols``
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    if n_nodes is None:
+        n_nodes = int(ids.max()) + 1 if len(ids) else 0
+
+    keys = []
+    for offset in range(1, min(window_size, len(ids))):
+        first = max(offset, start)
+        left, right = ids[first - offset:len(ids) - offset], ids[first:]
+        keys.append(np.minimum(left, right) * n_nodes + np.maximum(left, right))
+    if not keys:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+
+    pairs, weights = np.unique(np.concatenate(keys), return_counts=True)
+    return pairs // n_nodes, pairs % n_nodes, weights.astype(np.int64)
+
+
+def prune_edges(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    weights: np.ndarray,
+    occurrences: np.ndarray,
+    min_edge_weight: int = 1,
+    min_count: int = 1
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Drop edges lighter than ``min_edge_weight`` and words seen fewer than ``min_count`` times.
+
+    Pruning happens after counting, so the remaining edges keep the weights
+    they had in the full graph.
+
+    Args:
+        rows, cols, weights: Edge list as returned by ``count_cooccurrences``
+        occurrences: Number of occurrences of every word id
+        min_edge_weight: Smallest co-occurrence count an edge needs to be kept
+        min_count: Smallest number of occurrences a word needs to be kept
+
+    Returns:
+        Tuple of (kept, renumber, rows, cols, weights): the old ids of the kept
+        words in their original order, the new id of every old id (-1 for
+        dropped words) and the edge list renumbered over the kept words
+    """
+    kept_mask = occurrences >= min_count
+    kept = np.flatnonzero(kept_mask)
+    renumber = np.full(len(occurrences), -1, dtype=np.int64)
+    renumber[kept] = np.arange(len(kept))
+    edges = (weights >= min_edge_weight) & kept_mask[rows] & kept_mask[cols]
+    return kept, renumber, renumber[rows[edges]], renumber[cols[edges]], weights[edges]
+
+
+class CooccurrenceCounter:
+    """
+    Accumulate co-occurrence counts over a stream of word batches.
+
+    Only the last ``window_size - 1`` word ids are kept between batches, so
+    memory grows with the vocabulary and the number of distinct pairs, not
+    with the length of the stream. Pair counts from each batch are buffered
+    and periodically merged with a single ``np.unique`` reduction, once the
+    buffer holds at least as many pairs as the merged counts. Every pair is
+    therefore re-merged only a logarithmic number of times.
+
+    Args:
+        window_size: Size of the sliding window
+        merge_threshold: Minimum number of buffered pairs that triggers a merge
+    """
+
+    def __init__(self, window_size: int, merge_threshold: int = 1 << 18):
+        self.window_size = window_size
+        self.merge_threshold = merge_threshold
+        self.index: Dict[str, int] = {}
+        self.n_words = 0
+        self._tail = np.zeros(0, dtype=np.int64)
+        self._rows = np.zeros(0, dtype=np.int64)
+        self._cols = np.zeros(0, dtype=np.int64)
+        self._weights = np.zeros(0, dtype=np.int64)
+        self._occurrences = np.zeros(0, dtype=np.int64)
+        self._pending: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._pending_size = 0
+
+    @property
+    def vocabulary(self) -> List[str]:
+        return list(self.index)
+
+    def update(self, words: Iterable[str]) -> None:
+        """Append a batch of candidate words to the stream"""
+        index = self.index
+        ids = np.fromiter((index.setdefault(word, len(index)) for word in words), dtype=np.int64)
+        if not len(ids):
+            return
+        self.n_words += len(ids)
+        if len(index) > len(self._occurrences):
+            # Grown geometrically, so a batch costs O(len(batch)) rather than O(vocabulary)
+            occurrences = np.zeros(max(len(index), 2 * len(self._occurrences)), dtype=np.int64)
+            occurrences[:len(self._occurrences)] = self._occurrences
+            self._occurrences = occurrences
+        np.add.at(self._occurrences, ids, 1)
+
+        sequence = np.concatenate([self._tail, ids])
+        rows, cols, weights = count_cooccurrences(sequence, self.window_size, len(index), start=len(self._tail))
+        self._tail = sequence[-(self.window_size - 1):] if self.window_size > 1 else sequence[:0]
+        if len(rows):
+            self._pending.append((rows, cols, weights))
+            self._pending_size += len(rows)
+            # Waiting until the buffer is as large as the merged edges keeps merging amortized
+            if self._pending_size >= max(self.merge_threshold, len(self._rows)):
+                self._merge()
+
+    def _merge(self) -> None:
+        if not self._pending:
+            return
+        n_nodes = len(self.index)
+        rows = np.concatenate([self._rows] + [p[0] for p in self._pending])
+        cols = np.concatenate([self._cols] + [p[1] for p in self._pending])
+        weights = np.concatenate([self._weights] + [p[2] for p in self._pending])
+        pairs, inverse = np.unique(rows * n_nodes + cols, return_inverse=True)
+        self._rows, self._cols = pairs // n_nodes, pairs % n_nodes
+        self._weights = np.bincount(inverse.ravel(), weights=weights, minlength=len(pairs)).astype(np.int64)
+        self._pending = []
+        self._pending_size = 0
+
+    def occurrences(self) -> np.ndarray:
+        """Number of occurrences of every word id so far"""
+        return self._occurrences[:len(self.index)]
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the accumulated counts.
+
+        Returns:
+            Tuple of (rows, cols, weights) sorted by (row, col), with ``rows <= cols``
+        """
+        self._merge()
+        return self._rows, self._cols, self._weights
@@ -1,77 +1,535 @@
-import nltk
-import networkx as nx
-from nltk.tokenize import TreebankWordTokenizer
-from nltk.tag import pos_tag
-from nltk.corpus import stopwords
-from collections import defaultdict
+import numpy as np
+
+from .cooccurrence import CooccurrenceCounter, count_cooccurrences, encode_words, prune_edges
+from .document_frequency import check_weighting
+from .graph import WordGraph
+from .graph_io import write_pajek
+from .instrumentation import stage
+from .keyphrases import check_aggregation, merge_keyphrases
+from .parallel import map_with_extractor
+from .ranking import KeywordArrays, get_ranking_backend, top_k
+from .resources import stopword_set
+from .result_cache import content_hash, describe, make_key
+from .sentences import iter_sentences, split_sentences
+from .tagging import CandidateCache, get_tagger
+from .vocabulary import VocabularyView
+
+def _extract_keywords_task(extractor, task):
+    text, top_n, as_arrays = task
+    return extractor.extract_keywords(text, top_n, as_arrays=as_arrays)
+
+def _extract_keyphrases_task(extractor, task):
+    text, top_n, aggregation, word_ratio = task
+    return extractor.extract_keyphrases(text, top_n, aggregation=aggregation, word_ratio=word_ratio)
 
 class TextRankKeywordExtractor:
-    def __init__(self, window_size=5, pos_tags=('NN', 'NNS', 'JJ', 'JJR', 'JJS')):
+    def __init__(self, window_size=5, pos_tags=('NN', 'NNS', 'JJ', 'JJR', 'JJS'),
+                 ranking='sparse', damping=0.85, tol=1e-6, max_iter=100,
+                 tagger=None, tagging='text', tag_batch_size=64, candidate_cache_size=0,
+                 observer=None, result_cache=None, vocabulary=None,
+                 min_edge_weight=1, min_count=1, early_stopping=False, stable_iterations=3,
+                 document_frequency=None, weighting='idf'):
         self.window_size = window_size
         self.pos_tags = pos_tags
-        self.stop_words = set(stopwords.words('english'))
+        # NLTK is imported and its data resolved on first construction, not at package import
+        from nltk.tokenize import TreebankWordTokenizer
+        self.stop_words = set(stopword_set('english'))
         self.tokenizer = TreebankWordTokenizer()
-        
-    def _filter_words(self, text):
-        """Extract nouns and adjectives using POS tagging"""
-        tokens = self.tokenizer.tokenize(text)
-        # Use default English tagger
-        pos_tagged = pos_tag(tokens, lang='eng')
-        return [
-            word.lower() for word, tag in pos_tagged
-            if tag in self.pos_tags and word.isalnum() and word.lower() not in self.stop_words
+        # Ranking backend: 'sparse' (default), 'networkx' or a callable
+        self.ranking = ranking
+        self.damping = damping
+        self.tol = tol
+        self.max_iter = max_iter
+        # Approximate ranking for huge graphs: with early_stopping, iteration stops once
+        # the order of the requested top_n keywords is unchanged for stable_iterations
+        # iterations (the sparse backend only; networkx always runs to convergence).
+        # The observer's rank stage counts iterations and early_stopped runs, and reports
+        # the residual of the last run as a gauge.
+        self.early_stopping = early_stopping
+        self.stable_iterations = stable_iterations
+        # Graph pruning: edges seen fewer than min_edge_weight times and words seen
+        # fewer than min_count times are dropped before ranking
+        self.min_edge_weight = min_edge_weight
+        self.min_count = min_count
+        # Tagging: NLTK perceptron by default, or a Tagger / pos_tag-like callable.
+        # 'text' tags the whole text in one call; 'sentences' splits it into
+        # sentences and tags them in batches of tag_batch_size.
+        if tagging not in ('text', 'sentences'):
+            raise ValueError(f"tagging must be 'text' or 'sentences', got {tagging!r}")
+        self.tagger = get_tagger(tagger)
+        self.tagging = tagging
+        self.tag_batch_size = tag_batch_size
+        # Sentence-level tagging (and streaming) skips sentences whose tokens all
+        # have a cached candidate decision. 'text' mode tags the whole text at once and
+        # could never use the cache, so it is only accepted with tagging='sentences'.
+        if candidate_cache_size and tagging != 'sentences':
+            raise ValueError("candidate_cache_size requires tagging='sentences'")
+        self.candidate_cache = CandidateCache(candidate_cache_size) if candidate_cache_size else None
+        # Optional instrumentation.Observer notified with the timing of every pipeline stage
+        self.observer = observer
+        # Optional result_cache.ResultCache; extract_keywords returns stored results
+        # for text it has already seen with the same settings
+        self.result_cache = result_cache
+        # Optional vocabulary.Vocabulary shared across documents: graph nodes then carry
+        # its ids. Extraction only looks words up; it never adds them.
+        self.vocabulary = vocabulary
+        # Optional document_frequency.DocumentFrequencyIndex: keyword scores are multiplied
+        # by the corpus weight ('idf', 'tfidf' or 'bm25') of each word. Graphs are built on
+        # the index's vocabulary, so the weights are looked up by id.
+        check_weighting(weighting)
+        if document_frequency is not None:
+            if vocabulary is None:
+                self.vocabulary = document_frequency.vocabulary
+            elif vocabulary is not document_frequency.vocabulary:
+                raise ValueError("vocabulary must be the vocabulary of the document_frequency index")
+        self.document_frequency = document_frequency
+        self.weighting = weighting
+
+    def _is_candidate(self, word, tag):
+        return tag in self.pos_tags and word.isalnum() and word.lower() not in self.stop_words
+
+    def _filter_words(self, text, with_positions=False):
+        """
+        Extract nouns and adjectives using POS tagging
+
+        With with_positions, also return the token index of every candidate.
+        """
+        observer = self.observer
+        if self.tagging == 'sentences':
+            with stage(observer, 'tokenize') as s:
+                sentences = [self.tokenizer.tokenize(sentence) for sentence in split_sentences(text)]
+                s.count(sentences=len(sentences), tokens=sum(map(len, sentences)))
+            with stage(observer, 'tag_filter') as s:
+                filtered = self._filter_sentences(sentences, with_positions)
+                s.count(candidates=len(filtered[0] if with_positions else filtered))
+            return filtered
+        with stage(observer, 'tokenize') as s:
+            tokens = self.tokenizer.tokenize(text)
+            s.count(tokens=len(tokens))
+        with stage(observer, 'pos_tag'):
+            pos_tagged = self.tagger.tag(tokens)
+        with stage(observer, 'filter') as s:
+            if with_positions:
+                positions = [i for i, (word, tag) in enumerate(pos_tagged) if self._is_candidate(word, tag)]
+                words = [pos_tagged[i][0].lower() for i in positions]
+            else:
+                words = [word.lower() for word, tag in pos_tagged if self._is_candidate(word, tag)]
+            s.count(candidates=len(words))
+        return (words, positions) if with_positions else words
+
+    def _filter_texts(self, texts):
+        """Filter several texts; in 'text' mode they are tagged with a single tag_sents call"""
+        if self.tagging == 'sentences':
+            return [self._filter_words(text) for text in texts]
+        observer = self.observer
+        with stage(observer, 'tokenize') as s:
+            token_lists = [self.tokenizer.tokenize(text) for text in texts]
+            s.count(tokens=sum(map(len, token_lists)))
+        with stage(observer, 'pos_tag'):
+            tagged = self.tagger.tag_sents(token_lists)
+        with stage(observer, 'filter') as s:
+            word_lists = [
+                [word.lower() for word, tag in pos_tagged if self._is_candidate(word, tag)]
+                for pos_tagged in tagged
+            ]
+            s.count(candidates=sum(map(len, word_lists)))
+        return word_lists
+
+    def _filter_sentences(self, sentences, with_positions=False):
+        """Filter tokenized sentences, tagging in batches and skipping fully cached ones"""
+        cache = self.candidate_cache
+        flags = [None] * len(sentences)
+        pending = []
+
+        def tag_pending():
+            tagged_batch = self.tagger.tag_sents([sentences[i] for i in pending])
+            for i, pos_tagged in zip(pending, tagged_batch):
+                flags[i] = [self._is_candidate(word, tag) for word, tag in pos_tagged]
+                if cache is not None:
+                    cache.update(sentences[i], flags[i])
+            pending.clear()
+
+        for i, tokens in enumerate(sentences):
+            if cache is not None:
+                flags[i] = cache.lookup(tokens)
+            if flags[i] is None:
+                pending.append(i)
+                # Tag full batches right away so later repeats can hit the cache
+                if len(pending) >= self.tag_batch_size:
+                    tag_pending()
+        if pending:
+            tag_pending()
+
+        words = [
+            word.lower()
+            for tokens, sentence_flags in zip(sentences, flags)
+            for word, flag in zip(tokens, sentence_flags) if flag
         ]
+        if not with_positions:
+            return words
+        positions = []
+        offset = 0
+        for tokens, sentence_flags in zip(sentences, flags):
+            positions.extend(offset + i for i, flag in enumerate(sentence_flags) if flag)
+            # Leave a gap so that no keyphrase spans two sentences
+            offset += len(tokens) + 1
+        return words, positions
+
+    def cache_info(self):
+        """Hit/miss counters of the candidate cache, or None when it is disabled"""
+        if self.candidate_cache is None:
+            return None
+        return self.candidate_cache.info()
+
+    def _cache_config(self):
+        """Settings that affect extraction results, as part of the result cache key"""
+        return {
+            'window_size': self.window_size,
+            'pos_tags': sorted(self.pos_tags),
+            'stop_words': sorted(self.stop_words),
+            'ranking': describe(self.ranking),
+            'damping': self.damping,
+            'tol': self.tol,
+            'max_iter': self.max_iter,
+            'early_stopping': self.early_stopping,
+            'stable_iterations': self.stable_iterations,
+            'min_edge_weight': self.min_edge_weight,
+            'min_count': self.min_count,
+            'tagger': describe(self.tagger),
+            'tagging': self.tagging,
+            'candidate_cache': self.candidate_cache is not None,
+            'document_frequency': None if self.document_frequency is None else self.document_frequency.digest(),
+            'weighting': self.weighting,
+        }
+
+    def result_key(self, digest, top_n=None, mode='text'):
+        """Result cache key for content with the given SHA-256 digest under the current settings"""
+        return make_key(digest, self._cache_config(), top_n=top_n, mode=mode)
+
+    def _count_cooccurrences(self, words, min_edge_weight=None, min_count=None):
+        """Map words to integer ids and count co-occurrences within the window"""
+        return self._encode_and_count(words, min_edge_weight, min_count)[0]
+
+    def _encode_and_count(self, words, min_edge_weight=None, min_count=None):
+        """Return the co-occurrence graph and the node id of every candidate (-1 if pruned)"""
+        with stage(self.observer, 'cooccurrence') as s:
+            if self.vocabulary is None:
+                vocabulary, ids = encode_words(words)
+            else:
+                vocabulary, ids = self.vocabulary.encode_document(words)
+            rows, cols, weights = count_cooccurrences(ids, self.window_size, len(vocabulary))
+            vocabulary, renumber, rows, cols, weights = self._prune(
+                vocabulary, rows, cols, weights, lambda: np.bincount(ids, minlength=len(vocabulary)),
+                min_edge_weight, min_count)
+            if renumber is not None:
+                ids = renumber[ids]
+            graph = WordGraph.from_edges(vocabulary, rows, cols, weights)
+            s.count(nodes=len(vocabulary), edges=len(rows))
+        return graph, ids
 
-    def build_cooccurrence_graph(self, text):
-        """Construct weighted co-occurrence graph"""
-        words = self._filter_words(text)
-        graph = nx.Graph()
-        
-        # Create nodes for all candidate words
-        for word in set(words):
-            graph.add_node(word)
-            
-        # Build edges with weights based on co-occurrence
-        cooccurrence = defaultdict(int)
-        for i in range(len(words)):
-            for j in range(i+1, min(i+self.window_size, len(words))):
-                pair = tuple(sorted([words[i], words[j]]))
-                cooccurrence[pair] += 1
-                
-        for (w1, w2), count in cooccurrence.items():
-            graph.add_edge(w1, w2, weight=count)
-            
-        return graph
-
-    def extract_keywords(self, text, top_n=None):
+    def _prune(self, vocabulary, rows, cols, weights, occurrences, min_edge_weight=None, min_count=None):
+        """Apply min_edge_weight and min_count to an edge list; renumber is None if nothing can be pruned"""
+        min_edge_weight = self.min_edge_weight if min_edge_weight is None else min_edge_weight
+        min_count = self.min_count if min_count is None else min_count
+        # Every counted edge and word occurs at least once
+        if min_edge_weight <= 1 and min_count <= 1:
+            return vocabulary, None, rows, cols, weights
+        kept, renumber, rows, cols, weights = prune_edges(rows, cols, weights, occurrences(),
+                                                          min_edge_weight, min_count)
+        if isinstance(vocabulary, VocabularyView):
+            vocabulary = vocabulary.subset(kept)
+        else:
+            vocabulary = [vocabulary[i] for i in kept.tolist()]
+        return vocabulary, renumber, rows, cols, weights
+
+    def build_word_graph(self, text, min_edge_weight=None, min_count=None):
+        """
+        Construct the weighted co-occurrence graph as a sparse WordGraph
+
+        Args:
+            text (str): The input text
+            min_edge_weight (int, optional): Drop edges seen fewer times. Defaults to the extractor setting.
+            min_count (int, optional): Drop words seen fewer times. Defaults to the extractor setting.
+        """
+        return self._count_cooccurrences(self._filter_words(text), min_edge_weight, min_count)
+
+    def build_cooccurrence_graph(self, text, min_edge_weight=None, min_count=None):
+        """Construct weighted co-occurrence graph, optionally pruned (see build_word_graph)"""
+        return self.build_word_graph(text, min_edge_weight, min_count).to_networkx()
+
+    def rank_graph(self, graph, start=None, top_n=None):
+        """
+        Score a WordGraph with the configured ranking backend, optionally warm-started
+
+        With early_stopping and a top_n, ranking may stop before convergence once the
+        order of the top_n nodes is stable. The returned RankingResult reports the
+        iterations used and the residual reached.
+        """
+        backend = get_ranking_backend(self.ranking)
+        kwargs = {} if start is None else {'start': start}
+        if self.early_stopping and top_n is not None and top_n >= 0:
+            kwargs.update(stable_top_k=top_n, stable_iterations=self.stable_iterations)
+        return backend(graph, damping=self.damping, tol=self.tol, max_iter=self.max_iter, **kwargs)
+
+    def extract_keywords(self, text, top_n=None, as_arrays=False):
         """
         Extract keywords using weighted PageRank
-        
+
+        With a document_frequency index, scores are reweighted by the corpus
+        frequency of each word (see the weighting setting).
+
         Args:
             text (str): The input text to analyze
             top_n (int, optional): Number of top keywords to return. If None, returns all keywords.
-            
+            as_arrays (bool): If True, return a KeywordArrays of ids, words and float32 scores
+                instead of tuples. Ids are graph node ids, or ids in the shared vocabulary
+                if the extractor has one: extraction never adds words to it, and words it
+                does not contain get id -1. Array results bypass the result cache.
+
         Returns:
             List of tuples containing (word, score) pairs, sorted by score in descending order
         """
-        graph = self.build_cooccurrence_graph(text)
-        scores = nx.pagerank(graph, weight='weight')
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        
-        if top_n is None:
-            return sorted_scores
+        if as_arrays:
+            return self._keywords_from_words(self._filter_words(text), top_n, as_arrays)
+        return self._cached(text, top_n, 'text', lambda: self._keywords_from_words(self._filter_words(text), top_n))
+
+    def _keywords_from_words(self, words, top_n, as_arrays=False):
+        """Build, rank and select the keywords of one filtered text"""
+        if self.document_frequency is None:
+            return self._rank_keywords(self._count_cooccurrences(words), top_n, as_arrays)
+        graph, ids = self._encode_and_count(words)
+        scores = self._reweight(graph.vocabulary, self._rank(graph).scores, self._term_counts(graph, ids), len(ids))
+        return self._sorted_keywords(graph.vocabulary, scores, top_n, as_arrays)
+
+    @staticmethod
+    def _term_counts(graph, ids):
+        """Occurrences of every node in the filtered text (pruned words have id -1)"""
+        return np.bincount(ids[ids >= 0], minlength=graph.number_of_nodes())
+
+    def _reweight(self, vocabulary, scores, term_counts, length):
+        """Multiply TextRank scores by the corpus weights of the words, in one vectorized pass"""
+        with stage(self.observer, 'reweight') as s:
+            # Graphs built from text carry vocabulary ids; streamed graphs are looked up here
+            ids = getattr(vocabulary, 'ids', None)
+            if ids is None:
+                ids = self.vocabulary.lookup(vocabulary)
+            scores = scores * self.document_frequency.weights(ids, term_counts, length, self.weighting)
+            s.count(nodes=len(scores))
+        return scores
+
+    def add_documents(self, texts):
+        """
+        Count texts in the document frequency index, without rebuilding it
+
+        Texts are filtered exactly as for extraction, tag_batch_size at a time.
+
+        Args:
+            texts (iterable of str): The corpus documents to add
+        """
+        if self.document_frequency is None:
+            raise ValueError("the extractor has no document_frequency index")
+        texts = list(texts)
+        for start in range(0, len(texts), self.tag_batch_size):
+            for words in self._filter_texts(texts[start:start + self.tag_batch_size]):
+                self.document_frequency.add_document(words)
+
+    def _cached(self, text, top_n, mode, compute):
+        """Return compute() through the result cache, if one is configured"""
+        cache = self.result_cache
+        if cache is None:
+            return compute()
+        key = self.result_key(content_hash(text), top_n, mode)
+        with stage(self.observer, 'cache') as s:
+            result = cache.get(key)
+            s.count(hits=int(result is not None))
+        if result is None:
+            result = compute()
+            cache.put(key, result)
+        return result
+
+    def extract_keyphrases(self, text, top_n=None, aggregation='sum', word_ratio=1 / 3):
+        """
+        Extract multi-word keyphrases by collapsing adjacent top-ranked words
+
+        As in the TextRank paper, the top word_ratio of the ranked words are kept
+        and every run of them on consecutive tokens becomes one phrase. Token
+        positions come from the same tagging pass that builds the graph, so the
+        text is not tokenized or tagged a second time.
+
+        Args:
+            text (str): The input text to analyze
+            top_n (int, optional): Number of top keyphrases to return. If None, returns all keyphrases.
+            aggregation (str): How word scores combine into a phrase score: 'sum', 'mean' or 'max'
+            word_ratio (float): Fraction of the ranked words that phrases are built from
+
+        Returns:
+            List of tuples containing (phrase, score) pairs, sorted by score in descending order
+        """
+        check_aggregation(aggregation)
+        return self._cached(text, top_n, f'keyphrases:{aggregation}:{word_ratio!r}',
+                            lambda: self._rank_keyphrases(text, top_n, aggregation, word_ratio))
+
+    def _rank_keyphrases(self, text, top_n, aggregation, word_ratio):
+        words, positions = self._filter_words(text, with_positions=True)
+        graph, ids = self._encode_and_count(words)
+        n_words = graph.number_of_nodes()
+        n_selected = max(1, round(n_words * word_ratio))
+        if self.document_frequency is None:
+            scores = self._rank(graph, n_selected).scores
         else:
-            return sorted_scores[:top_n]
+            scores = self._reweight(graph.vocabulary, self._rank(graph).scores, self._term_counts(graph, ids), len(ids))
+        with stage(self.observer, 'phrases') as s:
+            selected = np.zeros(n_words, dtype=bool)
+            if n_words:
+                selected[top_k(scores, n_selected)] = True
+            phrases = merge_keyphrases(graph.vocabulary, ids, positions, scores, selected, aggregation)
+            s.count(phrases=len(phrases))
+        return self._sorted_keywords([phrase for phrase, _ in phrases],
+                                     np.array([score for _, score in phrases], dtype=np.float64), top_n)
+
+    def extract_keywords_from_graph(self, graph, top_n=None, as_arrays=False, term_counts=None):
+        """
+        Rank a prebuilt graph (e.g. from load_binary_graph or read_pajek) without touching any text
+
+        With a document_frequency index, scores are reweighted as in extract_keywords.
+        A graph does not record how often each word occurred, so 'tfidf' and 'bm25'
+        weighting need term_counts.
+
+        Args:
+            graph (WordGraph or networkx.Graph): The co-occurrence graph to rank
+            top_n (int, optional): Number of top keywords to return. If None, returns all keywords.
+            as_arrays (bool): If True, return a KeywordArrays instead of tuples
+            term_counts (array-like, optional): Occurrences of every node in the source text
+
+        Returns:
+            List of tuples containing (word, score) pairs, sorted by score in descending order
+        """
+        if not isinstance(graph, WordGraph):
+            graph = WordGraph.from_networkx(graph)
+        if self.document_frequency is None:
+            return self._rank_keywords(graph, top_n, as_arrays)
+        if term_counts is None:
+            if self.weighting != 'idf':
+                raise ValueError(f"{self.weighting!r} weighting needs the term_counts of the graph's nodes")
+            term_counts = np.ones(graph.number_of_nodes(), dtype=np.int64)
+        term_counts = np.asarray(term_counts, dtype=np.int64)
+        if len(term_counts) != graph.number_of_nodes():
+            raise ValueError("term_counts must have one entry per graph node")
+        scores = self._reweight(graph.vocabulary, self._rank(graph).scores, term_counts, int(term_counts.sum()))
+        return self._sorted_keywords(graph.vocabulary, scores, top_n, as_arrays)
+
+    def extract_keywords_stream(self, chunks, top_n=None, as_arrays=False):
+        """
+        Extract keywords from a stream of text chunks without holding the whole text
+
+        Text is split into sentences as it arrives and each sentence is tokenized
+        and tagged on its own. Only the last window_size - 1 candidate words are
+        carried between sentences, so windows still span sentence boundaries and
+        memory is bounded by the vocabulary rather than the document size.
+        Because the tokenizer and tagger see one sentence at a time, results
+        near sentence boundaries can differ slightly from extract_keywords on
+        the joined text (e.g. a sentence-final "word." is split into "word"
+        and "." here, so "word" can become a candidate).
+
+        Args:
+            chunks (iterable of str): Text fragments, split at arbitrary positions
+            top_n (int, optional): Number of top keywords to return. If None, returns all keywords.
+            as_arrays (bool): If True, return a KeywordArrays instead of tuples
+
+        Returns:
+            List of tuples containing (word, score) pairs, sorted by score in descending order
+        """
+        counter = CooccurrenceCounter(self.window_size)
+        batch = []
+        for sentence in iter_sentences(chunks):
+            batch.append(self.tokenizer.tokenize(sentence))
+            if len(batch) >= self.tag_batch_size:
+                counter.update(self._filter_sentences(batch))
+                batch = []
+        counter.update(self._filter_sentences(batch))
+        rows, cols, weights = counter.edges()
+        vocabulary, renumber, rows, cols, weights = self._prune(counter.vocabulary, rows, cols, weights,
+                                                                counter.occurrences)
+        graph = WordGraph.from_edges(vocabulary, rows, cols, weights)
+        if self.document_frequency is None:
+            return self._rank_keywords(graph, top_n, as_arrays)
+        term_counts = counter.occurrences()
+        if renumber is not None:
+            term_counts = term_counts[renumber >= 0]
+        scores = self._reweight(vocabulary, self._rank(graph).scores, term_counts, counter.n_words)
+        return self._sorted_keywords(vocabulary, scores, top_n, as_arrays)
+
+    def _rank_keywords(self, graph, top_n, as_arrays=False):
+        return self._sorted_keywords(graph.vocabulary, self._rank(graph, top_n).scores, top_n, as_arrays)
+
+    def _rank(self, graph, top_n=None):
+        with stage(self.observer, 'rank') as s:
+            result = self.rank_graph(graph, top_n=top_n)
+            n_nodes = graph.number_of_nodes()
+            residual = result.residual or 0.0
+            # Stopping before the residual drops below n * tol means early stopping kicked in
+            s.count(nodes=n_nodes, iterations=result.iterations or 0,
+                    early_stopped=int(residual >= n_nodes * self.tol))
+            s.gauge(residual=residual)
+        return result
+
+    def _sorted_keywords(self, vocabulary, scores, top_n, as_arrays=False):
+        """Select the top_n scores without sorting the rest; only the selected words are looked up"""
+        with stage(self.observer, 'select') as s:
+            order = top_k(scores, top_n)
+            words = [vocabulary[i] for i in order.tolist()]
+            if as_arrays:
+                # Nodes backed by a shared Vocabulary report its ids (-1 for words it does not contain)
+                node_ids = getattr(vocabulary, 'ids', None)
+                ids = order if node_ids is None else node_ids[order]
+                keywords = KeywordArrays(ids.astype('int32'), words, scores[order].astype('float32'))
+            else:
+                keywords = list(zip(words, scores[order].tolist()))
+            s.count(keywords=len(words))
+        return keywords
+
+    def extract_keywords_batch(self, texts, top_n=None, n_jobs=1, chunksize=1, return_exceptions=False,
+                               as_arrays=False):
+        """
+        Extract keywords from many texts, optionally across worker processes
+
+        Args:
+            texts (iterable of str): The input texts to analyze
+            top_n (int, optional): Number of top keywords to return per text. If None, returns all keywords.
+            n_jobs (int, optional): Number of worker processes. 1 runs in the current process; None or -1 uses all CPUs.
+            chunksize (int): Number of texts sent to a worker at a time
+            return_exceptions (bool): If True, a failing text yields its exception instead of aborting the batch
+            as_arrays (bool): If True, each result is a KeywordArrays instead of a list of tuples
+
+        Returns:
+            List with one keyword list per text, in input order
+        """
+        tasks = [(text, top_n, as_arrays) for text in texts]
+        return map_with_extractor(_extract_keywords_task, tasks, self, n_jobs=n_jobs,
+                                  chunksize=chunksize, return_exceptions=return_exceptions)
+
+    def extract_keyphrases_batch(self, texts, top_n=None, aggregation='sum', word_ratio=1 / 3,
+                                 n_jobs=1, chunksize=1, return_exceptions=False):
+        """
+        Extract keyphrases from many texts, optionally across worker processes
+
+        Args:
+            texts (iterable of str): The input texts to analyze
+            top_n (int, optional): Number of top keyphrases to return per text. If None, returns all keyphrases.
+            aggregation (str): How word scores combine into a phrase score: 'sum', 'mean' or 'max'
+            word_ratio (float): Fraction of the ranked words that phrases are built from
+            n_jobs (int, optional): Number of worker processes. 1 runs in the current process; None or -1 uses all CPUs.
+            chunksize (int): Number of texts sent to a worker at a time
+            return_exceptions (bool): If True, a failing text yields its exception instead of aborting the batch
+
+        Returns:
+            List with one keyphrase list per text, in input order
+        """
+        check_aggregation(aggregation)
+        tasks = [(text, top_n, aggregation, word_ratio) for text in texts]
+        return map_with_extractor(_extract_keyphrases_task, tasks, self, n_jobs=n_jobs,
+                                  chunksize=chunksize, return_exceptions=return_exceptions)
 
     def export_pajek(self, graph, filename):
-        """Export graph to Pajek format"""
-        with open(filename, 'w') as f:
-            # Write vertices
-            f.write(f"*Vertices {len(graph.nodes())}\n")
-            for i, node in enumerate(graph.nodes(), 1):
-                f.write(f'{i} "{node}"\n')
-            
-            # Write edges
-            f.write("*Edges\n")
-            for u, v, data in graph.edges(data=True):
-                f.write(f"{list(graph.nodes()).index(u)+1} {list(graph.nodes()).index(v)+1} {data['weight']}\n")
+        """Export graph to Pajek format (filename may be a path, a .gz path or an open stream)"""
+        write_pajek(graph, filename)
@@ -0,0 +1,188 @@
+"""Corpus document frequencies for TF-IDF and BM25 reweighting of keyword scores."""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Callable, Iterable, Optional, Union
+
+import numpy as np
+
+from .vocabulary import Vocabulary
+
+WEIGHTINGS = ('idf', 'tfidf', 'bm25')
+
+# BM25 term-frequency saturation and document-length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+COUNTS_FILE = 'document_frequency.npy'
+VOCABULARY_FILE = 'vocabulary.npz'
+METADATA_FILE = 'index.json'
+
+
+def check_weighting(weighting: str) -> None:
+    if weighting not in WEIGHTINGS:
+        raise ValueError(f"weighting must be one of {WEIGHTINGS}, got {weighting!r}")
+
+
+def _replace_file(path: str, write: Callable[[str], None]) -> None:
+    """Write through a temporary path, so readers (and memory maps) of the old file are unaffected"""
+    partial_path = os.path.join(os.path.dirname(path), '.partial-' + os.path.basename(path))
+    write(partial_path)
+    os.replace(partial_path, path)
+
+
+def _write_array(path: str, array: np.ndarray) -> None:
+    with open(path, 'wb') as f:
+        np.save(f, array)
+
+
+def _write_json(path: str, data: dict) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+class DocumentFrequencyIndex:
+    """
+    Number of corpus documents containing each word, keyed by ``Vocabulary`` id.
+
+    Counts live in one int32 array indexed by vocabulary id, so the weights
+    of all the nodes of a graph are looked up in a single vectorized pass.
+    Adding a document only increments the counts of its distinct words; the
+    index never has to be rebuilt.
+
+    An extractor given an index shares its vocabulary, so graph nodes already
+    carry the ids the counts are keyed by. Documents can be added from several
+    threads.
+
+    Args:
+        vocabulary: Vocabulary the counts are keyed by. If None, a new one is created.
+    """
+
+    def __init__(self, vocabulary: Optional[Vocabulary] = None):
+        self.vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+        self.n_documents = 0
+        self.total_length = 0
+        # Grown geometrically; ids at or past the end have a count of zero
+        self._counts = np.zeros(0, dtype=np.int32)
+        self._digest: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add_document(self, words: Iterable[str]) -> None:
+        """
+        Count one document.
+
+        Args:
+            words: The document's candidate words, e.g. from the extractor's filter
+        """
+        ids = self.vocabulary.encode(words)
+        distinct = np.unique(ids)
+        with self._lock:
+            if len(distinct) and distinct[-1] >= len(self._counts):
+                counts = np.zeros(max(int(distinct[-1]) + 1, 2 * len(self._counts)), dtype=np.int32)
+                counts[:len(self._counts)] = self._counts
+                self._counts = counts
+            self._counts[distinct] += 1
+            self.n_documents += 1
+            self.total_length += len(ids)
+            self._digest = None
+
+    def document_frequency(self, ids: np.ndarray) -> np.ndarray:
+        """Number of documents containing each of the given vocabulary ids (0 for id -1)"""
+        ids = np.asarray(ids, dtype=np.int64)
+        counts = self._counts
+        frequencies = np.zeros(len(ids), dtype=np.int64)
+        known = (ids >= 0) & (ids < len(counts))
+        frequencies[known] = counts[ids[known]]
+        return frequencies
+
+    def idf(self, ids: np.ndarray) -> np.ndarray:
+        """Smoothed inverse document frequency ``log((1 + N) / (1 + df)) + 1``"""
+        return np.log((1.0 + self.n_documents) / (1.0 + self.document_frequency(ids))) + 1.0
+
+    def weights(self, ids: np.ndarray, term_counts: np.ndarray, length: int, weighting: str = 'idf') -> np.ndarray:
+        """
+        Corpus weight of every word of one document.
+
+        Args:
+            ids: Vocabulary id of every word
+            term_counts: Occurrences of every word in the document
+            length: Number of candidate words in the document
+            weighting: 'idf', 'tfidf' (relative term frequency times idf) or
+                'bm25' (Okapi BM25 term weight)
+
+        Returns:
+            np.ndarray: One float64 weight per word
+        """
+        check_weighting(weighting)
+        if weighting == 'idf':
+            return self.idf(ids)
+        term_counts = np.asarray(term_counts, dtype=np.float64)
+        if weighting == 'tfidf':
+            return term_counts / max(length, 1) * self.idf(ids)
+        frequencies = self.document_frequency(ids)
+        idf = np.log1p((self.n_documents - frequencies + 0.5) / (frequencies + 0.5))
+        average_length = self.total_length / self.n_documents if self.n_documents else length
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / max(average_length, 1))
+        return idf * term_counts * (BM25_K1 + 1) / (term_counts + norm)
+
+    def digest(self) -> str:
+        """SHA-256 of the counts, recomputed only after documents are added"""
+        digest = self._digest
+        if digest is None:
+            with self._lock:
+                counts = np.trim_zeros(np.asarray(self._counts), 'b')
+                hasher = hashlib.sha256(f"{self.n_documents}:{self.total_length}:".encode('ascii'))
+                hasher.update(counts.astype('<i4').tobytes())
+                digest = self._digest = hasher.hexdigest()
+        return digest
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Write the index to the directory ``path``.
+
+        Counts are stored as a ``.npy`` array that ``load`` can memory-map, next
+        to the vocabulary and a small JSON header. Files are replaced
+        atomically, so an index loaded from the same directory keeps working.
+        """
+        path = os.fspath(path)
+        os.makedirs(path, exist_ok=True)
+        with self._lock:
+            n_words = len(self.vocabulary)
+            counts = np.zeros(n_words, dtype=np.int32)
+            known = min(n_words, len(self._counts))
+            counts[:known] = self._counts[:known]
+            metadata = {'version': 1, 'n_documents': self.n_documents, 'total_length': self.total_length}
+        _replace_file(os.path.join(path, VOCABULARY_FILE), self.vocabulary.save)
+        _replace_file(os.path.join(path, COUNTS_FILE), lambda partial: _write_array(partial, counts))
+        _replace_file(os.path.join(path, METADATA_FILE), lambda partial: _write_json(partial, metadata))
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], mmap: bool = True) -> 'DocumentFrequencyIndex':
+        """
+        Read an index written by ``save``.
+
+        Args:
+            path: Index directory
+            mmap: If True, counts are a copy-on-write memory map of the file:
+                pages are read on demand and adding documents never modifies
+                the file. Otherwise they are read into memory.
+        """
+        path = os.fspath(path)
+        with open(os.path.join(path, METADATA_FILE), 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+        index = cls(Vocabulary.load(os.path.join(path, VOCABULARY_FILE)))
+        index._counts = np.load(os.path.join(path, COUNTS_FILE), mmap_mode='c' if mmap else None)
+        index.n_documents = metadata['n_documents']
+        index.total_length = metadata['total_length']
+        return index
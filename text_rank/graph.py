@@ -0,0 +1,100 @@
+"""Sparse word graph shared by graph construction, ranking and export."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class WordGraph:
+    """
+    Undirected weighted word graph stored as a symmetric CSR adjacency matrix.
+
+    Args:
+        vocabulary: Node labels, one per row/column of the adjacency matrix
+        adjacency: Symmetric sparse matrix of edge weights. Self-loops are
+            stored once on the diagonal, as networkx does.
+    """
+
+    def __init__(self, vocabulary, adjacency):
+        # scipy is imported on use; it dominates the package's import time
+        from scipy import sparse
+
+        # Read-only sequences (e.g. a memory-mapped vocabulary) are kept as they are
+        self.vocabulary = vocabulary if isinstance(vocabulary, Sequence) else list(vocabulary)
+        self.adjacency = adjacency if sparse.isspmatrix_csr(adjacency) else sparse.csr_matrix(adjacency)
+        if not self.adjacency.has_sorted_indices:
+            self.adjacency.sort_indices()
+
+    @classmethod
+    def from_edges(cls, vocabulary, rows, cols, weights):
+        """
+        Build a graph from an edge list with one entry per undirected edge.
+
+        Args:
+            vocabulary: Node labels indexed by the ids used in ``rows``/``cols``
+            rows: Integer ids of the first endpoint of each edge
+            cols: Integer ids of the second endpoint of each edge
+            weights: Weight of each edge
+
+        Returns:
+            WordGraph: The symmetric graph
+        """
+        from scipy import sparse
+
+        n = len(vocabulary)
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        weights = np.asarray(weights)
+        off_diagonal = rows != cols
+        adjacency = sparse.csr_matrix(
+            (
+                np.concatenate([weights, weights[off_diagonal]]),
+                (np.concatenate([rows, cols[off_diagonal]]),
+                 np.concatenate([cols, rows[off_diagonal]])),
+            ),
+            shape=(n, n),
+        )
+        return cls(vocabulary, adjacency)
+
+    @classmethod
+    def from_networkx(cls, graph, weight='weight'):
+        """Convert a networkx graph, keeping its node order"""
+        import networkx as nx
+
+        vocabulary = list(graph.nodes())
+        adjacency = nx.to_scipy_sparse_array(graph, nodelist=vocabulary, weight=weight)
+        return cls(vocabulary, adjacency)
+
+    def number_of_nodes(self):
+        return len(self.vocabulary)
+
+    def number_of_edges(self):
+        return len(self.edges()[0])
+
+    def edges(self):
+        """
+        Return the undirected edge list in row-major order.
+
+        Returns:
+            Tuple of (rows, cols, weights) arrays with ``rows <= cols``
+        """
+        from scipy import sparse
+
+        upper = sparse.triu(self.adjacency, format='csr')
+        upper.sort_indices()
+        coo = upper.tocoo()
+        return coo.row, coo.col, coo.data
+
+    def to_networkx(self):
+        """Convert to a ``networkx.Graph`` with ``weight`` edge attributes"""
+        import networkx as nx
+
+        graph = nx.Graph()
+        graph.add_nodes_from(self.vocabulary)
+        rows, cols, weights = self.edges()
+        vocabulary = self.vocabulary
+        graph.add_weighted_edges_from(
+            (vocabulary[u], vocabulary[v], w)
+            for u, v, w in zip(rows.tolist(), cols.tolist(), weights.tolist())
+        )
+        return graph
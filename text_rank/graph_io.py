@@ -0,0 +1,313 @@
+"""Graph serialization shared by the extractor and the batch export helpers."""
+
+import gzip
+import json
+import os
+from collections.abc import Sequence
+from contextlib import contextmanager
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .graph import WordGraph
+
+# Number of vertex/edge lines joined into a single write call
+WRITE_BLOCK_LINES = 65536
+
+PathOrStream = Union[str, os.PathLike, IO[str]]
+
+
+@contextmanager
+def open_text(destination: PathOrStream, mode: str = 'w', encoding: Optional[str] = None) -> Iterator[IO[str]]:
+    """
+    Open a path for text I/O, or pass an already-open stream through unchanged.
+
+    Paths ending in ``.gz`` are transparently gzip-compressed. Streams passed
+    in are not closed.
+    """
+    if hasattr(destination, 'write') or hasattr(destination, 'read'):
+        yield destination
+        return
+    if os.fspath(destination).endswith('.gz'):
+        f = gzip.open(destination, mode + 't', encoding=encoding)
+    else:
+        f = open(destination, mode, encoding=encoding)
+    with f:
+        yield f
+
+
+def _vertices_and_edges(graph) -> Tuple[List[str], Iterator[Tuple[int, int, object]]]:
+    """Return node labels and (u, v, weight) edges with 0-based node indices"""
+    if isinstance(graph, WordGraph):
+        rows, cols, weights = graph.edges()
+        return graph.vocabulary, zip(rows.tolist(), cols.tolist(), weights.tolist())
+
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = ((index[u], index[v], data['weight']) for u, v, data in graph.edges(data=True))
+    return nodes, edges
+
+
+def _write_blocks(f: IO[str], lines: Iterator[str]) -> None:
+    block = []
+    for line in lines:
+        block.append(line)
+        if len(block) >= WRITE_BLOCK_LINES:
+            f.write(''.join(block))
+            block = []
+    if block:
+        f.write(''.join(block))
+
+
+def write_pajek(
+    graph,
+    destination: PathOrStream,
+    encoding: Optional[str] = None,
+    network_name: Optional[str] = None
+) -> None:
+    """
+    Write a graph in Pajek ``.net`` format.
+
+    Nodes are indexed once up front, so export is linear in the size of the
+    graph, and lines are written in large blocks.
+
+    Args:
+        graph: ``networkx.Graph`` with ``weight`` edge attributes, or a ``WordGraph``
+        destination: File path (``.gz`` for gzip output) or an open text stream
+        encoding: Encoding used when ``destination`` is a path
+        network_name: If given, the graph is preceded by a ``*Network`` line,
+            as used when several graphs share one file
+    """
+    nodes, edges = _vertices_and_edges(graph)
+    with open_text(destination, 'w', encoding=encoding) as f:
+        if network_name is not None:
+            f.write(f"\n*Network {network_name}\n")
+        # Write vertices
+        f.write(f"*Vertices {len(nodes)}\n")
+        _write_blocks(f, (f'{i} "{node}"\n' for i, node in enumerate(nodes, 1)))
+        # Write edges
+        f.write("*Edges\n")
+        _write_blocks(f, (f"{u + 1} {v + 1} {weight}\n" for u, v, weight in edges))
+
+
+
+def _parse_weight(token: str):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _build_pajek_graph(labels: List[Optional[str]], rows: List[int], cols: List[int], weights: list) -> WordGraph:
+    vocabulary = [str(i) if label is None else label for i, label in enumerate(labels, 1)]
+    return WordGraph.from_edges(vocabulary, rows, cols, np.array(weights) if weights else np.zeros(0, dtype=np.int64))
+
+
+def read_pajek(source: PathOrStream, encoding: Optional[str] = None) -> Iterator[Tuple[Optional[str], WordGraph]]:
+    """
+    Parse Pajek ``.net`` data one network at a time.
+
+    Handles single graphs as written by ``write_pajek`` as well as files with
+    several ``*Network`` sections. Only the network currently being parsed is
+    held in memory. ``*Arcs`` are read as undirected edges and repeated edges
+    have their weights summed; edges without a weight get weight 1.
+
+    Args:
+        source: File path (``.gz`` is decompressed) or an open text stream
+        encoding: Encoding used when ``source`` is a path
+
+    Yields:
+        Tuples of (network name or None, WordGraph)
+    """
+    name = None
+    labels: Optional[List[Optional[str]]] = None
+    rows: List[int] = []
+    cols: List[int] = []
+    weights: list = []
+    section = None
+
+    with open_text(source, 'r', encoding=encoding) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('%'):
+                continue
+            if line.startswith('*'):
+                keyword, _, rest = line.partition(' ')
+                keyword = keyword.lower()
+                if keyword == '*network':
+                    if labels is not None:
+                        yield name, _build_pajek_graph(labels, rows, cols, weights)
+                    name, labels, rows, cols, weights = rest.strip() or None, None, [], [], []
+                    section = None
+                elif keyword == '*vertices':
+                    if labels is not None:
+                        # A second *Vertices without *Network starts a new unnamed graph
+                        yield name, _build_pajek_graph(labels, rows, cols, weights)
+                        name, rows, cols, weights = None, [], [], []
+                    labels = [None] * int(rest.split()[0])
+                    section = 'vertices'
+                elif keyword in ('*edges', '*arcs'):
+                    section = 'edges'
+                elif keyword in ('*edgeslist', '*arcslist'):
+                    section = 'edgeslist'
+                else:
+                    raise ValueError(f"Unsupported Pajek section: {line}")
+                continue
+
+            if section == 'vertices':
+                number, _, rest = line.partition(' ')
+                rest = rest.strip()
+                if rest.startswith('"'):
+                    label = rest[1:rest.index('"', 1)]
+                else:
+                    label = rest.split()[0] if rest else None
+                labels[int(number) - 1] = label
+            elif section == 'edges':
+                parts = line.split()
+                rows.append(int(parts[0]) - 1)
+                cols.append(int(parts[1]) - 1)
+                weights.append(_parse_weight(parts[2]) if len(parts) > 2 else 1)
+            elif section == 'edgeslist':
+                source_node, *targets = (int(part) - 1 for part in line.split())
+                for target in targets:
+                    rows.append(source_node)
+                    cols.append(target)
+                    weights.append(1)
+            else:
+                raise ValueError(f"Unexpected line outside a Pajek section: {line}")
+
+    if labels is not None:
+        yield name, _build_pajek_graph(labels, rows, cols, weights)
+
+# Binary graph format: magic, little-endian uint64 header length, JSON header,
+# then arrays at 64-byte aligned offsets relative to the start of the data section
+BINARY_MAGIC = b'TRGRAPH1'
+BINARY_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return -(-offset // BINARY_ALIGNMENT) * BINARY_ALIGNMENT
+
+
+class PackedVocabulary(Sequence):
+    """
+    Read-only vocabulary stored as one UTF-8 blob plus an offsets array.
+
+    Words are decoded on access, so a memory-mapped vocabulary costs nothing
+    until labels are actually needed (e.g. for the final top keywords).
+    """
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self.offsets = offsets
+        self.data = data
+
+    @classmethod
+    def from_words(cls, words) -> 'PackedVocabulary':
+        encoded = [word.encode('utf-8') for word in words]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(word) for word in encoded], out=offsets[1:])
+        return cls(offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode('utf-8')
+
+    def __iter__(self):
+        blob = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            yield blob[start:end].decode('utf-8')
+
+
+def save_binary_graph(graph, path: Union[str, os.PathLike]) -> None:
+    """
+    Save a graph as a vocabulary table plus CSR arrays (indptr, indices, weights).
+
+    Index arrays are stored as int32 whenever they fit, which is also what
+    scipy uses, so ``load_binary_graph`` can wrap the mapped arrays without copying.
+
+    Args:
+        graph: ``WordGraph`` or ``networkx.Graph`` with ``weight`` edge attributes
+        path: Output file path
+    """
+    if not isinstance(graph, WordGraph):
+        graph = WordGraph.from_networkx(graph)
+    adjacency = graph.adjacency
+    vocabulary = graph.vocabulary
+    if not isinstance(vocabulary, PackedVocabulary):
+        vocabulary = PackedVocabulary.from_words(vocabulary)
+
+    index_dtype = np.int32 if max(adjacency.shape[0], adjacency.nnz) < np.iinfo(np.int32).max else np.int64
+    arrays = {
+        'indptr': adjacency.indptr.astype(index_dtype, copy=False),
+        'indices': adjacency.indices.astype(index_dtype, copy=False),
+        'weights': adjacency.data,
+        'vocabulary_offsets': vocabulary.offsets.astype(np.int64, copy=False),
+        'vocabulary_data': vocabulary.data,
+    }
+
+    layout: Dict[str, dict] = {}
+    offset = 0
+    for name, array in arrays.items():
+        dtype = array.dtype.newbyteorder('<')
+        layout[name] = {'dtype': dtype.str, 'length': len(array), 'offset': offset}
+        offset = _align(offset + len(array) * dtype.itemsize)
+    header = json.dumps({'version': 1, 'n_nodes': len(vocabulary), 'arrays': layout}).encode('utf-8')
+    data_start = _align(len(BINARY_MAGIC) + 8 + len(header))
+
+    with open(path, 'wb') as f:
+        f.write(BINARY_MAGIC)
+        f.write(np.uint64(len(header)).astype('<u8').tobytes())
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(np.ascontiguousarray(array, dtype=layout[name]['dtype']).tobytes())
+        f.truncate(data_start + offset)
+
+
+def load_binary_graph(path: Union[str, os.PathLike], mmap: bool = True) -> WordGraph:
+    """
+    Load a graph written by ``save_binary_graph``.
+
+    Args:
+        path: Input file path
+        mmap: If True, arrays are read-only ``numpy.memmap`` views of the file;
+            otherwise they are read into memory
+
+    Returns:
+        WordGraph: Graph whose vocabulary is a ``PackedVocabulary``
+    """
+    from scipy import sparse
+
+    with open(path, 'rb') as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a text_rank binary graph")
+        header_length = int(np.frombuffer(f.read(8), dtype='<u8')[0])
+        header = json.loads(f.read(header_length).decode('utf-8'))
+    data_start = _align(len(BINARY_MAGIC) + 8 + header_length)
+
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        offset = data_start + spec['offset']
+        if spec['length'] == 0:
+            arrays[name] = np.zeros(0, dtype=dtype)
+        elif mmap:
+            arrays[name] = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(spec['length'],))
+        else:
+            arrays[name] = np.fromfile(path, dtype=dtype, count=spec['length'], offset=offset)
+
+    n = header['n_nodes']
+    adjacency = sparse.csr_matrix(
+        (arrays['weights'], arrays['indices'], arrays['indptr']), shape=(n, n), copy=False
+    )
+    vocabulary = PackedVocabulary(arrays['vocabulary_offsets'], arrays['vocabulary_data'])
+    return WordGraph(vocabulary, adjacency)
@@ -0,0 +1,221 @@
+"""Incremental keyword ranking for documents that are edited in place."""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .cooccurrence import count_cooccurrences
+from .core import TextRankKeywordExtractor
+from .graph import WordGraph
+from .ranking import RankingResult
+from .sentences import SENTENCE_BOUNDARY
+
+
+class IncrementalTextRank:
+    """
+    Stateful TextRank session that updates its graph as the text changes.
+
+    Each edit re-tokenizes and re-tags only the sentence(s) around the edited
+    span, and updates only the co-occurrence counts of windows that overlap
+    the changed candidates. Ranking is warm-started from the previous scores,
+    so a small edit converges in a few power iterations.
+
+    Re-processed sentences are tokenized exactly as they are within the full
+    text. With a context-free tagger, results therefore match a full
+    ``extract_keywords`` run after any sequence of edits. A contextual tagger
+    (such as NLTK's perceptron) sees only the re-processed sentences, and
+    candidates in text the edit did not touch keep their original tags. This
+    can make results drift slightly from a full run after many edits.
+
+    Args:
+        extractor: Extractor providing tokenizer, tagger, filters and ranking settings
+        text: Initial document text
+    """
+
+    def __init__(self, extractor: Optional[TextRankKeywordExtractor] = None, text: str = ''):
+        self.extractor = extractor if extractor is not None else TextRankKeywordExtractor()
+        self._text = ''
+        # Candidate word ids and character offsets, in document order
+        self._ids: List[int] = []
+        self._starts = np.zeros(0, dtype=np.int64)
+        self._index: Dict[str, int] = {}
+        self._vocabulary: List[str] = []
+        self._occurrences: List[int] = []
+        self._pairs: Dict[Tuple[int, int], int] = {}
+        self._scores: Dict[int, float] = {}
+        self.last_result: Optional[RankingResult] = None
+        if text:
+            self.append(text)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def append(self, text: str) -> None:
+        """Append text at the end of the document"""
+        self.replace(len(self._text), len(self._text), text)
+
+    def insert(self, position: int, text: str) -> None:
+        """Insert text at a character offset"""
+        self.replace(position, position, text)
+
+    def remove(self, start: int, end: int) -> None:
+        """Remove the characters in ``[start, end)``"""
+        self.replace(start, end, '')
+
+    def replace(self, start: int, end: int, text: str) -> None:
+        """
+        Replace the characters in ``[start, end)`` with ``text``.
+
+        Args:
+            start: Offset of the first replaced character
+            end: Offset one past the last replaced character
+            text: Replacement text (empty for a deletion)
+        """
+        if not 0 <= start <= end <= len(self._text):
+            raise ValueError(f"Invalid span [{start}, {end}) for a text of length {len(self._text)}")
+
+        # Re-process whole sentences around the edit so tags keep their context
+        region_start, region_end = self._sentence_region(start, end)
+        region = self._text[region_start:start] + text + self._text[end:region_end]
+        new_words, new_offsets = self._candidates(region, final=not self._text[region_end:].strip())
+        new_ids = [self._intern(word) for word in new_words]
+        new_starts = [region_start + offset for offset in new_offsets]
+
+        # Candidates [a, b) lie inside the old region and are replaced
+        a = int(self._starts.searchsorted(region_start))
+        b = int(self._starts.searchsorted(region_end))
+        w = self.extractor.window_size
+        left = self._ids[max(0, a - w + 1):a]
+        right = self._ids[b:b + w - 1]
+        # Only windows reaching into [a, b) change; pairs that lie entirely inside
+        # `left` or `right` are counted in both segments and cancel out
+        self._add_counts(left + self._ids[a:b] + right, -1)
+        self._add_counts(left + new_ids + right, 1)
+        for i in self._ids[a:b]:
+            self._occurrences[i] -= 1
+        for i in new_ids:
+            self._occurrences[i] += 1
+
+        shift = len(text) - (end - start)
+        self._ids[a:b] = new_ids
+        self._starts = np.concatenate([
+            self._starts[:a], np.array(new_starts, dtype=np.int64), self._starts[b:] + shift
+        ])
+        self._text = self._text[:start] + text + self._text[end:]
+
+    def keywords(self, top_n: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Rank the current document, warm-starting from the previous scores.
+
+        The extractor's ``min_edge_weight`` and ``min_count`` are applied to the
+        current counts, and with a ``document_frequency`` index scores are
+        reweighted, exactly as ``extract_keywords`` does.
+
+        Args:
+            top_n: Number of top keywords to return. If None, returns all keywords.
+
+        Returns:
+            List of tuples containing (word, score) pairs, sorted by score in descending order
+        """
+        active = [i for i, count in enumerate(self._occurrences) if count > 0]
+        position = {word_id: k for k, word_id in enumerate(active)}
+        pairs = list(self._pairs.items())
+        rows = np.array([position[u] for (u, _), _ in pairs], dtype=np.int64)
+        cols = np.array([position[v] for (_, v), _ in pairs], dtype=np.int64)
+        weights = np.array([count for _, count in pairs], dtype=np.int64)
+        occurrences = np.array([self._occurrences[i] for i in active], dtype=np.int64)
+        words, renumber, rows, cols, weights = self.extractor._prune(
+            [self._vocabulary[i] for i in active], rows, cols, weights, lambda: occurrences)
+        if renumber is not None:
+            kept = np.flatnonzero(renumber >= 0)
+            active = [active[k] for k in kept.tolist()]
+            occurrences = occurrences[kept]
+        graph = WordGraph.from_edges(words, rows, cols, weights)
+
+        start = None
+        if self._scores and active:
+            # New words start from the mean of the known scores
+            fallback = float(np.mean(list(self._scores.values())))
+            start = np.array([self._scores.get(i, fallback) for i in active])
+        result = self.extractor.rank_graph(graph, start=start)
+        self.last_result = result
+        self._scores = dict(zip(active, result.scores.tolist()))
+        scores = result.scores
+        if self.extractor.document_frequency is not None:
+            # Warm starts use the TextRank scores; only the returned scores are reweighted
+            scores = self.extractor._reweight(graph.vocabulary, scores, occurrences, len(self._ids))
+        return self.extractor._sorted_keywords(graph.vocabulary, scores, top_n)
+
+    def _sentence_region(self, start: int, end: int) -> Tuple[int, int]:
+        """Widen ``[start, end)`` to the enclosing sentence boundaries"""
+        text = self._text
+        region_start = self._sentence_start(start)
+        if end >= len(text.rstrip()) and region_start > 0:
+            # An edit at the end of the document decides whether the sentence before it
+            # is the last one, which changes how its final period is tokenized
+            previous_end = region_start
+            while previous_end > 0 and text[previous_end - 1].isspace():
+                previous_end -= 1
+            region_start = self._sentence_start(previous_end)
+        boundary = SENTENCE_BOUNDARY.search(text, end)
+        region_end = boundary.start() if boundary else len(text)
+        return region_start, max(region_end, end)
+
+    def _sentence_start(self, position: int) -> int:
+        """Offset where the sentence containing ``position`` starts"""
+        text = self._text
+        lookback = 256
+        while position > 0:
+            window_start = max(0, position - lookback)
+            boundaries = list(SENTENCE_BOUNDARY.finditer(text, window_start, position))
+            if boundaries:
+                return boundaries[-1].end()
+            if window_start == 0:
+                break
+            lookback *= 2
+        return 0
+
+    def _candidates(self, text: str, final: bool = True) -> Tuple[List[str], List[int]]:
+        """
+        Return candidate words of ``text`` with their character offsets.
+
+        Treebank tokenization splits a period off a word only at the very end
+        of the string. Unless ``text`` ends the document, it is therefore
+        tokenized with a placeholder word appended, which is then dropped.
+        """
+        extractor = self.extractor
+        if not final:
+            text += ' x'
+        tokens = extractor.tokenizer.tokenize(text)
+        spans = list(extractor.tokenizer.span_tokenize(text))
+        if len(spans) != len(tokens):
+            tokens = [text[s:e] for s, e in spans]
+        if not final:
+            tokens, spans = tokens[:-1], spans[:-1]
+        words, offsets = [], []
+        for (word, tag), (span_start, _) in zip(extractor.tagger.tag(tokens), spans):
+            if extractor._is_candidate(word, tag):
+                words.append(word.lower())
+                offsets.append(span_start)
+        return words, offsets
+
+    def _intern(self, word: str) -> int:
+        word_id = self._index.get(word)
+        if word_id is None:
+            word_id = self._index[word] = len(self._vocabulary)
+            self._vocabulary.append(word)
+            self._occurrences.append(0)
+        return word_id
+
+    def _add_counts(self, ids: List[int], sign: int) -> None:
+        if len(ids) < 2:
+            return
+        rows, cols, weights = count_cooccurrences(ids, self.extractor.window_size, len(self._vocabulary))
+        pairs = self._pairs
+        for u, v, count in zip(rows.tolist(), cols.tolist(), weights.tolist()):
+            total = pairs.get((u, v), 0) + sign * count
+            if total:
+                pairs[(u, v)] = total
+            else:
+                del pairs[(u, v)]
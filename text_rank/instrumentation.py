@@ -0,0 +1,242 @@
+"""Opt-in per-stage instrumentation for the extraction pipeline."""
+
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from typing import Callable, Dict, NamedTuple, Optional, Sequence
+
+# Upper bounds (seconds) of the latency histogram buckets; a final +Inf bucket is implied
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class StageEvent(NamedTuple):
+    """One measured execution of a pipeline stage."""
+    stage: str
+    seconds: float
+    counts: Dict[str, float]
+    memory: Optional[int] = None
+    # Point-in-time values (e.g. a ranking residual) that are not meaningful to sum
+    gauges: Optional[Dict[str, float]] = None
+
+
+class Observer:
+    """
+    Receives a ``StageEvent`` after every instrumented stage.
+
+    Stages reported by ``TextRankKeywordExtractor``: ``tokenize``, ``pos_tag``,
+    ``filter`` (``tag_filter`` when tagging by sentence), ``cooccurrence``,
+    ``rank`` (counting ``iterations`` and ``early_stopped`` runs, with the
+    ``residual`` reached as a gauge),
+    ``select``, ``cache`` (result cache lookups), ``phrases`` (keyphrase
+    merging) and ``reweight`` (document frequency weighting).
+    ``TextRankSummarizer`` also reports ``similarity``.
+
+    Set ``track_memory`` to have each event carry the peak bytes allocated
+    during the stage. This is measured with tracemalloc, which slows the
+    pipeline down noticeably. A stage that finds tracing off turns it on for
+    its own duration and off again afterwards. If tracing is already on (e.g.
+    started by the application), it is left running.
+    """
+
+    track_memory = False
+
+    def on_stage(self, event: StageEvent) -> None:
+        raise NotImplementedError
+
+
+class CallbackObserver(Observer):
+    """Forward every event to a callable"""
+
+    def __init__(self, callback: Callable[[StageEvent], None], track_memory: bool = False):
+        self.callback = callback
+        self.track_memory = track_memory
+
+    def on_stage(self, event):
+        self.callback(event)
+
+
+class _StageStats:
+    def __init__(self, buckets: Sequence[float]):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.counts: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self.peak_memory: Optional[int] = None
+
+
+class StageCollector(Observer):
+    """
+    Built-in observer that aggregates events per stage.
+
+    Keeps call counts, total and maximum wall time, a latency histogram, summed
+    item counts, the last value of every gauge and (with ``track_memory``) the
+    largest per-stage allocation peak.
+    With ``n_jobs > 1`` every worker process records into its own copy.
+
+    Args:
+        buckets: Upper bounds in seconds of the latency histogram buckets
+        track_memory: Record per-stage memory peaks with tracemalloc
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, track_memory: bool = False):
+        self.buckets = tuple(buckets)
+        self.track_memory = track_memory
+        self._stages: Dict[str, _StageStats] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def on_stage(self, event):
+        with self._lock:
+            stats = self._stages.get(event.stage)
+            if stats is None:
+                stats = self._stages[event.stage] = _StageStats(self.buckets)
+            stats.calls += 1
+            stats.seconds += event.seconds
+            stats.max_seconds = max(stats.max_seconds, event.seconds)
+            stats.bucket_counts[bisect_left(self.buckets, event.seconds)] += 1
+            for name, value in event.counts.items():
+                stats.counts[name] = stats.counts.get(name, 0) + value
+            if event.gauges:
+                stats.gauges.update(event.gauges)
+            if event.memory is not None:
+                stats.peak_memory = max(stats.peak_memory or 0, event.memory)
+
+    def summary(self) -> Dict[str, dict]:
+        """Per-stage totals as plain dictionaries"""
+        with self._lock:
+            return {
+                stage: {
+                    'calls': stats.calls,
+                    'seconds_total': stats.seconds,
+                    'seconds_max': stats.max_seconds,
+                    'counts': dict(stats.counts),
+                    'gauges': dict(stats.gauges),
+                    'peak_memory_bytes': stats.peak_memory,
+                }
+                for stage, stats in self._stages.items()
+            }
+
+    def histograms(self) -> Dict[str, dict]:
+        """
+        Per-stage latency histograms with cumulative bucket counts.
+
+        Returns:
+            ``{stage: {'buckets': [...], 'counts': [...], 'sum': s, 'count': n}}``
+            where ``counts[i]`` is the number of calls at or below ``buckets[i]``
+            and the last bucket is ``inf``
+        """
+        with self._lock:
+            result = {}
+            for stage, stats in self._stages.items():
+                cumulative, total = [], 0
+                for count in stats.bucket_counts:
+                    total += count
+                    cumulative.append(total)
+                result[stage] = {
+                    'buckets': list(self.buckets) + [float('inf')],
+                    'counts': cumulative,
+                    'sum': stats.seconds,
+                    'count': stats.calls,
+                }
+            return result
+
+    def to_prometheus(self, prefix: str = 'text_rank') -> str:
+        """Render the histograms, item counters and gauges in the Prometheus text format"""
+        lines = [f"# TYPE {prefix}_stage_seconds histogram"]
+        for stage, histogram in self.histograms().items():
+            for bound, count in zip(histogram['buckets'], histogram['counts']):
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {histogram["sum"]!r}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {histogram["count"]}')
+        summaries = self.summary()
+        lines.append(f"# TYPE {prefix}_stage_items_total counter")
+        for stage, summary in summaries.items():
+            for name, value in summary['counts'].items():
+                lines.append(f'{prefix}_stage_items_total{{stage="{stage}",item="{name}"}} {value}')
+        lines.append(f"# TYPE {prefix}_stage_gauge gauge")
+        for stage, summary in summaries.items():
+            for name, value in summary['gauges'].items():
+                lines.append(f'{prefix}_stage_gauge{{stage="{stage}",name="{name}"}} {value!r}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+
+class _Stage:
+    __slots__ = ('observer', 'name', 'counts', 'gauges', 'start', 'memory_start', 'started_tracing')
+
+    def __init__(self, observer: Observer, name: str):
+        self.observer = observer
+        self.name = name
+        self.counts: Dict[str, float] = {}
+        self.gauges: Optional[Dict[str, float]] = None
+        self.started_tracing = False
+
+    def count(self, **counts: float) -> None:
+        self.counts.update(counts)
+
+    def gauge(self, **values: float) -> None:
+        if self.gauges is None:
+            self.gauges = {}
+        self.gauges.update(values)
+
+    def __enter__(self):
+        if self.observer.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracing = True
+            tracemalloc.reset_peak()
+            self.memory_start = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        memory = None
+        if self.observer.track_memory and tracemalloc.is_tracing():
+            memory = tracemalloc.get_traced_memory()[1] - self.memory_start
+        if self.started_tracing:
+            tracemalloc.stop()
+        if exc_type is not None:
+            return
+        self.observer.on_stage(StageEvent(self.name, seconds, self.counts, memory, self.gauges))
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def count(self, **counts: float) -> None:
+        pass
+
+    def gauge(self, **values: float) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(observer: Optional[Observer], name: str):
+    """Context manager measuring one stage; a shared no-op when ``observer`` is None"""
+    if observer is None:
+        return _NULL_STAGE
+    return _Stage(observer, name)
@@ -0,0 +1,62 @@
+"""Collapse adjacent top-ranked words into multi-word keyphrases."""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+AGGREGATIONS = ('sum', 'mean', 'max')
+
+
+def check_aggregation(aggregation: str) -> None:
+    if aggregation not in AGGREGATIONS:
+        raise ValueError(f"aggregation must be one of {AGGREGATIONS}, got {aggregation!r}")
+
+
+def merge_keyphrases(
+    vocabulary: Sequence[str],
+    ids: np.ndarray,
+    positions: np.ndarray,
+    scores: np.ndarray,
+    selected: np.ndarray,
+    aggregation: str = 'sum'
+) -> List[Tuple[str, float]]:
+    """
+    Merge runs of adjacent selected words into phrases in one pass over the candidates.
+
+    Args:
+        vocabulary: Words indexed by id
+        ids: Word id of every candidate occurrence, in text order (-1 for pruned words)
+        positions: Token index of every candidate occurrence; candidates on
+            consecutive tokens belong to the same phrase
+        scores: Word scores aligned with ``vocabulary``
+        selected: Boolean mask over ``vocabulary`` of the words phrases are made of
+        aggregation: How word scores combine into a phrase score: 'sum', 'mean' or 'max'
+
+    Returns:
+        Unique (phrase, score) pairs in order of first occurrence
+    """
+    check_aggregation(aggregation)
+    ids = np.asarray(ids)
+    # Words pruned from the graph have id -1 and never take part in a phrase
+    keep = np.flatnonzero((ids >= 0) & selected[np.maximum(ids, 0)])
+    if len(keep) == 0:
+        return []
+    kept_ids = ids[keep]
+    kept_positions = np.asarray(positions)[keep]
+    # A phrase starts wherever the previous kept word is not on the preceding token
+    starts = np.flatnonzero(np.diff(kept_positions, prepend=kept_positions[0] - 2) != 1)
+    word_scores = scores[kept_ids]
+    if aggregation == 'max':
+        phrase_scores = np.maximum.reduceat(word_scores, starts)
+    else:
+        phrase_scores = np.add.reduceat(word_scores, starts)
+        if aggregation == 'mean':
+            phrase_scores = phrase_scores / np.diff(starts, append=len(keep))
+
+    kept_ids = kept_ids.tolist()
+    bounds = starts.tolist() + [len(kept_ids)]
+    phrases = {}
+    for start, end, score in zip(bounds[:-1], bounds[1:], phrase_scores.tolist()):
+        phrase = ' '.join([vocabulary[i] for i in kept_ids[start:end]])
+        phrases.setdefault(phrase, score)
+    return list(phrases.items())
@@ -0,0 +1,92 @@
+"""Process-pool helpers that keep one extractor per worker process."""
+
+import os
+from functools import partial
+from multiprocessing import Pool
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+# Extractor installed in each worker process by the pool initializer
+_worker_extractor = None
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """Translate ``n_jobs`` (None or negative meaning "all CPUs") into a process count"""
+    if n_jobs is None or n_jobs < 0:
+        return os.cpu_count() or 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a positive integer, -1 or None")
+    return n_jobs
+
+
+def _init_worker(extractor) -> None:
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _call(func, extractor, item, return_exceptions):
+    if not return_exceptions:
+        return func(extractor, item)
+    try:
+        return func(extractor, item)
+    except Exception as e:
+        return e
+
+
+def _call_in_worker(func, return_exceptions, item):
+    return _call(func, _worker_extractor, item, return_exceptions)
+
+
+def imap_with_extractor(
+    func: Callable[[Any, Any], Any],
+    items: Iterable[Any],
+    extractor,
+    n_jobs: Optional[int] = 1,
+    chunksize: int = 1,
+    return_exceptions: bool = False
+) -> Iterator[Any]:
+    """
+    Like ``map_with_extractor``, but yield results in input order as they arrive.
+
+    Lets callers consume (e.g. write out) early results while later items are
+    still being processed, without holding every result in memory.
+    """
+    items = list(items)
+    n_jobs = min(resolve_n_jobs(n_jobs), max(len(items), 1))
+    if n_jobs == 1:
+        for item in items:
+            yield _call(func, extractor, item, return_exceptions)
+        return
+
+    with Pool(n_jobs, initializer=_init_worker, initargs=(extractor,)) as pool:
+        yield from pool.imap(partial(_call_in_worker, func, return_exceptions), items, chunksize)
+
+
+def map_with_extractor(
+    func: Callable[[Any, Any], Any],
+    items: Iterable[Any],
+    extractor,
+    n_jobs: Optional[int] = 1,
+    chunksize: int = 1,
+    return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Apply ``func(extractor, item)`` to every item, fanning out over a process pool.
+
+    The extractor is sent to each worker once, when the worker starts, and is
+    then reused for every item that worker handles.
+
+    Args:
+        func: Module-level (picklable) function taking ``(extractor, item)``
+        items: Work items
+        extractor: Extractor shared by all calls
+        n_jobs: Number of worker processes. 1 runs in the current process;
+            None or -1 uses all CPUs.
+        chunksize: Number of items sent to a worker at a time
+        return_exceptions: If True, an exception raised for an item is returned
+            in that item's slot instead of aborting the whole map
+
+    Returns:
+        List of results in input order
+    """
+    return list(imap_with_extractor(func, items, extractor, n_jobs=n_jobs,
+                                    chunksize=chunksize, return_exceptions=return_exceptions))
@@ -0,0 +1,166 @@
+"""PageRank backends used to score word graphs."""
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+
+class PowerIterationFailedConvergence(RuntimeError):
+    """Raised when power iteration does not converge within ``max_iter`` steps."""
+
+
+class RankingResult(NamedTuple):
+    """Scores aligned with ``WordGraph.vocabulary`` plus convergence details."""
+    scores: np.ndarray
+    iterations: Optional[int] = None
+    residual: Optional[float] = None
+
+
+class KeywordArrays(NamedTuple):
+    """Top keywords as parallel arrays, best first."""
+    ids: np.ndarray
+    words: List[str]
+    scores: np.ndarray
+
+
+def pagerank(
+    adjacency,
+    damping: float = 0.85,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    start: Optional[np.ndarray] = None,
+    stable_top_k: Optional[int] = None,
+    stable_iterations: int = 3
+) -> RankingResult:
+    """
+    Weighted PageRank by power iteration on a sparse adjacency matrix.
+
+    Follows ``networkx.pagerank``: rows are normalized by their weighted
+    degree, dangling nodes redistribute their score uniformly and iteration
+    stops once the L1 change drops below ``n * tol``.
+
+    With ``stable_top_k``, iteration also stops as soon as the order of the
+    ``stable_top_k`` best nodes has not changed for ``stable_iterations``
+    consecutive iterations. This is a heuristic: nodes with nearly equal
+    scores may still swap places later, and all scores are approximate. The
+    returned residual tells how far from convergence they were.
+
+    Args:
+        adjacency: Square sparse matrix of edge weights
+        damping: Probability of following an edge rather than teleporting
+        tol: Per-node convergence tolerance
+        max_iter: Maximum number of power iterations
+        start: Initial score vector (normalized to sum to one), e.g. the scores
+            of a previous, similar graph. Defaults to uniform.
+        stable_top_k: Number of top nodes whose order decides early stopping
+        stable_iterations: Iterations the top order must stay unchanged
+
+    Returns:
+        RankingResult: Scores summing to one, iterations used and final residual
+    """
+    from scipy import sparse
+
+    n = adjacency.shape[0]
+    if n == 0:
+        return RankingResult(np.zeros(0), 0, 0.0)
+
+    out_weight = np.asarray(adjacency.sum(axis=1), dtype=np.float64).ravel()
+    dangling = out_weight == 0
+    inverse = np.zeros(n)
+    inverse[~dangling] = 1.0 / out_weight[~dangling]
+    # Transposed transition matrix so each step is a plain CSR mat-vec
+    transition = (sparse.diags(inverse) @ sparse.csr_matrix(adjacency, dtype=np.float64)).T.tocsr()
+    teleport = (1.0 - damping) / n
+
+    if start is None:
+        scores = np.full(n, 1.0 / n)
+    else:
+        scores = np.asarray(start, dtype=np.float64)
+        scores = scores / scores.sum()
+    ranking = None
+    unchanged = 0
+    for iteration in range(1, max_iter + 1):
+        previous = scores
+        scores = damping * (transition @ previous + previous[dangling].sum() / n) + teleport
+        residual = float(np.abs(scores - previous).sum())
+        if residual < n * tol:
+            return RankingResult(scores, iteration, residual)
+        if stable_top_k is not None:
+            current = top_k(scores, stable_top_k)
+            unchanged = unchanged + 1 if ranking is not None and np.array_equal(current, ranking) else 0
+            if unchanged >= stable_iterations:
+                return RankingResult(scores, iteration, residual)
+            ranking = current
+    raise PowerIterationFailedConvergence(
+        f"PageRank did not converge in {max_iter} iterations (residual {residual:.3g})"
+    )
+
+
+def rank_sparse(graph, damping: float = 0.85, tol: float = 1e-6, max_iter: int = 100, start=None,
+                stable_top_k=None, stable_iterations: int = 3) -> RankingResult:
+    """Rank a ``WordGraph`` with the NumPy/SciPy power iteration"""
+    return pagerank(graph.adjacency, damping=damping, tol=tol, max_iter=max_iter, start=start,
+                    stable_top_k=stable_top_k, stable_iterations=stable_iterations)
+
+
+def rank_networkx(graph, damping: float = 0.85, tol: float = 1e-6, max_iter: int = 100, start=None,
+                  stable_top_k=None, stable_iterations: int = 3) -> RankingResult:
+    """Rank a ``WordGraph`` with ``networkx.pagerank`` (reference implementation; always runs to convergence)"""
+    import networkx as nx
+
+    nstart = None if start is None else dict(zip(graph.vocabulary, np.asarray(start, dtype=np.float64).tolist()))
+    scores = nx.pagerank(graph.to_networkx(), alpha=damping, tol=tol, max_iter=max_iter, nstart=nstart, weight='weight')
+    return RankingResult(np.array([scores[word] for word in graph.vocabulary], dtype=np.float64))
+
+
+def top_k(scores: np.ndarray, top_n: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of the ``top_n`` highest scores, best first.
+
+    Equal scores keep their index order, exactly like a stable descending sort.
+    With ``top_n`` set only the nodes at or above the k-th largest score are
+    sorted, found with ``np.partition`` in linear time.
+
+    Args:
+        scores: Score vector
+        top_n: Number of indices to return. If None, all indices are returned.
+
+    Returns:
+        np.ndarray: Node indices ordered by descending score
+    """
+    scores = np.asarray(scores)
+    n = len(scores)
+    if top_n is None or top_n >= n or top_n < 0:
+        order = np.argsort(-scores, kind='stable')
+        return order if top_n is None else order[:top_n]
+    if top_n == 0:
+        return np.zeros(0, dtype=np.intp)
+    threshold = np.partition(scores, n - top_n)[n - top_n]
+    # Everything tied with the k-th score takes part, so ties resolve by index
+    candidates = np.flatnonzero(scores >= threshold)
+    return candidates[np.argsort(-scores[candidates], kind='stable')][:top_n]
+
+
+RANKING_BACKENDS: Dict[str, Callable[..., RankingResult]] = {
+    'sparse': rank_sparse,
+    'networkx': rank_networkx,
+}
+
+
+def get_ranking_backend(backend: Union[str, Callable[..., RankingResult]]) -> Callable[..., RankingResult]:
+    """
+    Resolve a ranking backend by name, or pass a callable through.
+
+    Custom backends are called as ``backend(graph, damping=..., tol=..., max_iter=...)``
+    and must return a ``RankingResult``. Warm-started ranking (``IncrementalTextRank``)
+    also passes ``start=``, the initial score vector, and an extractor with
+    ``early_stopping`` passes ``stable_top_k=`` and ``stable_iterations=``.
+    """
+    if callable(backend):
+        return backend
+    try:
+        return RANKING_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown ranking backend {backend!r}; expected one of {sorted(RANKING_BACKENDS)} or a callable"
+        ) from None
@@ -0,0 +1,81 @@
+"""Lazy resolution of the NLTK resources used by the extractor."""
+
+import os
+from typing import Dict, FrozenSet
+
+# Resource name -> path used by nltk.data.find
+REQUIRED_DATA: Dict[str, str] = {
+    'stopwords': 'corpora/stopwords',
+    'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng',
+    'universal_tagset': 'taggers/universal_tagset'
+}
+
+# Set to 1/true/yes to let first use download missing resources
+AUTO_DOWNLOAD_ENV = 'TEXT_RANK_AUTO_DOWNLOAD'
+
+_available = set()
+_stopwords: Dict[str, FrozenSet[str]] = {}
+
+
+def _auto_download() -> bool:
+    return os.environ.get(AUTO_DOWNLOAD_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+def _download(resource: str) -> None:
+    import nltk
+
+    print(f"Downloading {resource}...")
+    nltk.download(resource, quiet=True)
+
+
+def require(resource: str) -> None:
+    """
+    Make sure an NLTK resource is installed, checking the filesystem only once.
+
+    Missing resources are downloaded only if ``TEXT_RANK_AUTO_DOWNLOAD`` is set;
+    otherwise a LookupError explains how to install them.
+    """
+    if resource in _available:
+        return
+    import nltk
+
+    try:
+        nltk.data.find(REQUIRED_DATA[resource])
+    except LookupError:
+        if not _auto_download():
+            raise LookupError(
+                f"NLTK resource '{resource}' is not installed. Call text_rank.prepare() "
+                f"or set {AUTO_DOWNLOAD_ENV}=1 to download it."
+            ) from None
+        _download(resource)
+        nltk.data.find(REQUIRED_DATA[resource])
+    _available.add(resource)
+
+
+def prepare() -> None:
+    """Download any missing NLTK data used by text_rank"""
+    import nltk
+
+    for resource, path in REQUIRED_DATA.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            # Verified on first use, in case the download failed
+            _download(resource)
+            continue
+        _available.add(resource)
+
+
+def ensure_nltk_data() -> None:
+    """Ensure NLTK data is downloaded (alias of ``prepare``)"""
+    prepare()
+
+
+def stopword_set(language: str = 'english') -> FrozenSet[str]:
+    """Return the NLTK stopword list for ``language``, loaded once per process"""
+    if language not in _stopwords:
+        require('stopwords')
+        from nltk.corpus import stopwords
+
+        _stopwords[language] = frozenset(stopwords.words(language))
+    return _stopwords[language]
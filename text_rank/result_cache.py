@@ -0,0 +1,209 @@
+"""Content-addressed cache of keyword extraction results."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, List, NamedTuple, Optional, Tuple, Union
+
+Keywords = List[Tuple[str, float]]
+
+# Bytes hashed per read when fingerprinting files
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def content_hash(content: Union[str, bytes]) -> str:
+    """SHA-256 hex digest of a text (UTF-8 encoded) or of raw bytes"""
+    if isinstance(content, str):
+        content = content.encode('utf-8', 'surrogatepass')
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_hash(file_path: Union[str, os.PathLike]) -> str:
+    """SHA-256 hex digest of a file's raw bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def describe(obj: Any) -> Any:
+    """
+    JSON-compatible description of a configuration value.
+
+    Functions and classes are identified by their qualified name, other objects
+    by their type and (recursively) their attributes. Two different lambdas
+    therefore look the same; give custom taggers/backends distinct names.
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return [describe(item) for item in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted(describe(item) for item in obj)
+    if isinstance(obj, dict):
+        return {str(key): describe(value) for key, value in obj.items()}
+    if callable(obj) and hasattr(obj, '__qualname__'):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    cls = type(obj)
+    state = {key: describe(value) for key, value in sorted(vars(obj).items())} if hasattr(obj, '__dict__') else {}
+    return {'type': f"{cls.__module__}.{cls.__qualname__}", **state}
+
+
+def make_key(digest: str, config: dict, **params: Any) -> str:
+    """Combine a content digest, an extractor configuration and call parameters into a cache key"""
+    payload = json.dumps({'config': config, 'params': params}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(f"{digest}:{payload}".encode('utf-8')).hexdigest()
+
+
+class ResultCacheInfo(NamedTuple):
+    """Hit/miss counters and sizes of a ``ResultCache``."""
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    disk_bytes: Optional[int] = None
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """
+    Two-tier cache of extraction results keyed by ``make_key``.
+
+    Results are kept in an in-memory LRU of ``maxsize`` entries and, when
+    ``path`` is given, in a SQLite file that survives across runs and can be
+    shared by worker processes. Disk entries are stored as compressed JSON and
+    the least recently used ones are evicted once the file holds more than
+    ``max_disk_bytes`` of results. A disk hit is promoted to the memory tier.
+
+    The cache is safe to use from several threads. When pickled (e.g. sent to
+    worker processes with the extractor) the copy reopens the same SQLite file.
+
+    Args:
+        maxsize: Maximum number of results kept in memory (0 disables the memory tier)
+        path: SQLite file for the on-disk tier; None keeps results in memory only
+        max_disk_bytes: Size limit of the stored (compressed) results on disk
+    """
+
+    def __init__(self, maxsize: int = 1024, path: Optional[Union[str, os.PathLike]] = None,
+                 max_disk_bytes: int = 256 << 20):
+        self.maxsize = maxsize
+        self.path = os.fspath(path) if path is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[str, Keywords]" = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_connection'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[Keywords]:
+        """Return a copy of the cached result for ``key``, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return list(value)
+            if self.path is not None:
+                db = self._db()
+                row = db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+                    value = [tuple(item) for item in json.loads(zlib.decompress(row[0]))]
+                    self._remember(key, value)
+                    self.disk_hits += 1
+                    return list(value)
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Keywords) -> None:
+        """Store a result in both tiers"""
+        value = [tuple(item) for item in value]
+        with self._lock:
+            self._remember(key, value)
+            if self.path is not None:
+                blob = zlib.compress(json.dumps(value, separators=(',', ':')).encode('utf-8'))
+                db = self._db()
+                db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", (key, blob, len(blob), time.time()))
+                self._evict_disk(db)
+
+    def _remember(self, key: str, value: Keywords) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _evict_disk(self, db: sqlite3.Connection) -> None:
+        excess = (db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]) - self.max_disk_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in db.execute("SELECT key, size FROM results ORDER BY accessed"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        db.executemany("DELETE FROM results WHERE key = ?", victims)
+
+    def info(self) -> ResultCacheInfo:
+        with self._lock:
+            disk_bytes = None
+            if self.path is not None:
+                disk_bytes = self._db().execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            return ResultCacheInfo(self.memory_hits, self.disk_hits, self.misses,
+                                   self.maxsize, len(self._entries), disk_bytes)
+
+    def clear(self) -> None:
+        """Drop all entries from both tiers and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            if self.path is not None:
+                self._db().execute("DELETE FROM results")
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """Close the SQLite connection (it is reopened on next use)"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
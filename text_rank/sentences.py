@@ -0,0 +1,61 @@
+"""Lightweight sentence splitting for streamed text."""
+
+import re
+from typing import Iterable, Iterator, List
+
+# A sentence ends at terminal punctuation followed by whitespace, or at a blank line
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n\s*\n')
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences on terminal punctuation and blank lines.
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of non-empty sentences
+    """
+    return [sentence for sentence in SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+def iter_sentences(chunks: Iterable[str], max_buffer: int = 65536) -> Iterator[str]:
+    """
+    Yield complete sentences from a stream of text chunks.
+
+    Only the unfinished tail of the stream is buffered. If no boundary shows up
+    within ``max_buffer`` characters (e.g. unpunctuated logs), the buffer is
+    cut at its last whitespace so memory stays bounded.
+
+    Args:
+        chunks: Iterable of text fragments, split anywhere
+        max_buffer: Maximum number of characters held while waiting for a boundary
+
+    Yields:
+        Non-empty sentences in stream order
+    """
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        last_end = 0
+        for match in SENTENCE_BOUNDARY.finditer(buffer):
+            # A match touching the end of the buffer may continue in the next chunk
+            if match.end() == len(buffer):
+                break
+            sentence = buffer[last_end:match.start()]
+            if sentence.strip():
+                yield sentence
+            last_end = match.end()
+        buffer = buffer[last_end:]
+
+        while len(buffer) > max_buffer:
+            cut = max(buffer.rfind(' ', 0, max_buffer), buffer.rfind('\n', 0, max_buffer))
+            if cut <= 0:
+                cut = max_buffer
+            if buffer[:cut].strip():
+                yield buffer[:cut]
+            buffer = buffer[cut:]
+
+    if buffer.strip():
+        yield buffer
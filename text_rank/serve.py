@@ -0,0 +1,410 @@
+"""
+Headless HTTP server for keyword extraction.
+
+Start a server with two warm worker processes:
+
+    python -m text_rank.serve --port 8000 --workers 2
+
+Endpoints:
+
+    POST /keywords  {"text": "...", "top_n": 10}
+                    -> {"keywords": [[word, score], ...]}
+    POST /graph     {"text": "...", "format": "pajek" | "json"}
+                    -> Pajek text, or {"nodes": [...], "edges": [[u, v, weight], ...]}
+    GET  /metrics   Request, latency and batching counters as JSON
+                    (/metrics?format=prometheus for the Prometheus text format)
+    GET  /health    {"status": "ok"}
+
+Requests that arrive within --batch-window-ms of each other are sent to a
+worker together, and the texts of a batch are POS-tagged in one call.
+"""
+
+import argparse
+import io
+import json
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from . import parallel
+from .core import TextRankKeywordExtractor
+from .graph_io import write_pajek
+from .instrumentation import StageCollector, StageEvent
+from .parallel import _init_worker, resolve_n_jobs
+from .resources import prepare
+
+GRAPH_FORMATS = ('pajek', 'json')
+
+WARM_UP_TEXT = "Loading the tagger model and the ranking backend before the first request arrives."
+
+
+def _warm_worker(extractor: TextRankKeywordExtractor) -> None:
+    _init_worker(extractor)
+    extractor.extract_keywords(WARM_UP_TEXT)
+
+
+def _graph_payload(graph, graph_format: str):
+    if graph_format == 'pajek':
+        buffer = io.StringIO()
+        write_pajek(graph, buffer)
+        return buffer.getvalue()
+    rows, cols, weights = graph.edges()
+    return {
+        'nodes': list(graph.vocabulary),
+        'edges': [list(edge) for edge in zip(rows.tolist(), cols.tolist(), weights.tolist())],
+    }
+
+
+def _process_batch(items: List[Dict[str, Any]]) -> List[Tuple[bool, Any]]:
+    """Run one micro-batch in a worker: tag every text in one call, then build and rank each graph"""
+    extractor = parallel._worker_extractor
+    try:
+        word_lists = extractor._filter_texts([item['text'] for item in items])
+    except Exception as e:
+        return [(False, f"{type(e).__name__}: {e}")] * len(items)
+
+    results = []
+    for item, words in zip(items, word_lists):
+        try:
+            if item['kind'] == 'keywords':
+                results.append((True, extractor._keywords_from_words(words, item['top_n'])))
+            else:
+                results.append((True, _graph_payload(extractor._count_cooccurrences(words), item['format'])))
+        except Exception as e:
+            results.append((False, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class ServerMetrics:
+    """Request counters plus per-endpoint and per-batch latency histograms"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.latency = StageCollector()
+        self.batches = StageCollector()
+        self._statuses: Dict[str, Dict[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def record_request(self, endpoint: str, status: int, seconds: float) -> None:
+        self.latency.on_stage(StageEvent(endpoint, seconds, {}))
+        with self._lock:
+            counts = self._statuses.setdefault(endpoint, {})
+            counts[status] = counts.get(status, 0) + 1
+
+    def record_batch(self, size: int, seconds: float) -> None:
+        self.batches.on_stage(StageEvent('batch', seconds, {'items': size}))
+
+    def snapshot(self) -> Dict[str, Any]:
+        uptime = time.time() - self.started
+        latency = self.latency.summary()
+        with self._lock:
+            statuses = {endpoint: dict(counts) for endpoint, counts in self._statuses.items()}
+        requests = {}
+        for endpoint, counts in statuses.items():
+            summary = latency.get(endpoint, {})
+            calls = summary.get('calls', 0)
+            requests[endpoint] = {
+                'count': calls,
+                'status': {str(status): count for status, count in sorted(counts.items())},
+                'per_second': calls / uptime if uptime else 0.0,
+                'mean_seconds': summary['seconds_total'] / calls if calls else 0.0,
+                'max_seconds': summary.get('seconds_max', 0.0),
+            }
+        batch = self.batches.summary().get('batch')
+        return {
+            'uptime_seconds': uptime,
+            'requests': requests,
+            'latency_histograms': self.latency.histograms(),
+            'batches': {
+                'count': batch['calls'] if batch else 0,
+                'items': batch['counts'].get('items', 0) if batch else 0,
+                'mean_size': batch['counts'].get('items', 0) / batch['calls'] if batch else 0.0,
+                'mean_seconds': batch['seconds_total'] / batch['calls'] if batch else 0.0,
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        lines = [
+            "# TYPE text_rank_server_uptime_seconds gauge",
+            f"text_rank_server_uptime_seconds {time.time() - self.started!r}",
+            "# TYPE text_rank_server_responses_total counter",
+        ]
+        with self._lock:
+            for endpoint, counts in self._statuses.items():
+                for status, count in sorted(counts.items()):
+                    lines.append(f'text_rank_server_responses_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+        return ('\n'.join(lines) + '\n'
+                + self.latency.to_prometheus('text_rank_server_request')
+                + self.batches.to_prometheus('text_rank_server_batch'))
+
+
+class MicroBatcher:
+    """
+    Group requests that arrive close together and send each group to the pool.
+
+    A batch is closed after ``window`` seconds or ``max_batch`` requests. At
+    most ``max_in_flight`` batches are on the pool at once; while they run,
+    new requests keep accumulating, so batches grow with the load.
+
+    Args:
+        pool: Executor whose workers have an extractor installed
+        window: Seconds to wait for more requests after the first one of a batch
+        max_batch: Maximum number of requests per batch
+        max_in_flight: Maximum number of batches submitted to the pool at once
+        metrics: Receives the size and round-trip time of every batch
+    """
+
+    def __init__(self, pool: Executor, window: float = 0.005, max_batch: int = 32,
+                 max_in_flight: int = 2, metrics: Optional[ServerMetrics] = None):
+        self.pool = pool
+        self.window = window
+        self.max_batch = max_batch
+        self.metrics = metrics
+        self._queue: "queue.Queue[Optional[Tuple[Dict[str, Any], Future]]]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._thread = threading.Thread(target=self._run, name='text_rank-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Dict[str, Any]) -> Future:
+        """Queue one request; the returned future resolves to ``(ok, result or error message)``"""
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is None:
+                    running = False
+                    break
+                batch.append(entry)
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[Tuple[Dict[str, Any], Future]]) -> None:
+        self._slots.acquire()
+        started = time.perf_counter()
+        try:
+            pool_future = self.pool.submit(_process_batch, [item for item, _ in batch])
+        except Exception as e:
+            self._slots.release()
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        def resolve(done: Future) -> None:
+            self._slots.release()
+            if self.metrics is not None:
+                self.metrics.record_batch(len(batch), time.perf_counter() - started)
+            error = done.exception()
+            if error is not None:
+                for _, future in batch:
+                    future.set_exception(error)
+                return
+            for (_, future), outcome in zip(batch, done.result()):
+                future.set_result(outcome)
+
+        pool_future.add_done_callback(resolve)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: 'TextRankServer'
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body, content_type: str = 'application/json') -> None:
+        if content_type == 'application/json':
+            body = json.dumps(body)
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/health':
+            self._send(HTTPStatus.OK, {'status': 'ok'})
+        elif url.path == '/metrics':
+            if parse_qs(url.query).get('format') == ['prometheus']:
+                self._send(HTTPStatus.OK, self.server.metrics.to_prometheus(), 'text/plain')
+            else:
+                self._send(HTTPStatus.OK, self.server.metrics.snapshot())
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {'error': f"Unknown endpoint {url.path}"})
+
+    def do_POST(self):
+        endpoint = urlparse(self.path).path
+        started = time.perf_counter()
+        status, body, content_type = self._handle_post(endpoint)
+        self._send(status, body, content_type)
+        if endpoint in ('/keywords', '/graph'):
+            self.server.metrics.record_request(endpoint, int(status), time.perf_counter() - started)
+
+    def _handle_post(self, endpoint: str):
+        if endpoint not in ('/keywords', '/graph'):
+            return HTTPStatus.NOT_FOUND, {'error': f"Unknown endpoint {endpoint}"}, 'application/json'
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            # The body's extent is unknown, so the connection cannot be reused
+            self.close_connection = True
+            return HTTPStatus.BAD_REQUEST, {'error': "Invalid Content-Length"}, 'application/json'
+        if length > self.server.max_body_bytes:
+            # Never read an oversized body; closing the connection discards it
+            self.close_connection = True
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': "Request body too large"}, 'application/json'
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+            item = self._parse(endpoint, request)
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, {'error': str(e)}, 'application/json'
+
+        try:
+            ok, result = self.server.batcher.submit(item).result(timeout=self.server.request_timeout)
+        except FutureTimeoutError:
+            return HTTPStatus.GATEWAY_TIMEOUT, {'error': "Extraction timed out"}, 'application/json'
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"{type(e).__name__}: {e}"}, 'application/json'
+        if not ok:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': result}, 'application/json'
+        if item['kind'] == 'keywords':
+            return HTTPStatus.OK, {'keywords': [list(pair) for pair in result]}, 'application/json'
+        if item['format'] == 'pajek':
+            return HTTPStatus.OK, result, 'text/plain'
+        return HTTPStatus.OK, result, 'application/json'
+
+    @staticmethod
+    def _parse(endpoint: str, request) -> Dict[str, Any]:
+        if not isinstance(request, dict) or not isinstance(request.get('text'), str):
+            raise ValueError("Request body must be a JSON object with a string 'text'")
+        if endpoint == '/keywords':
+            top_n = request.get('top_n')
+            if top_n is not None and (not isinstance(top_n, int) or isinstance(top_n, bool) or top_n < 0):
+                raise ValueError("'top_n' must be a non-negative integer or null")
+            return {'kind': 'keywords', 'text': request['text'], 'top_n': top_n}
+        graph_format = request.get('format', 'json')
+        if graph_format not in GRAPH_FORMATS:
+            raise ValueError(f"'format' must be one of {GRAPH_FORMATS}")
+        return {'kind': 'graph', 'text': request['text'], 'format': graph_format}
+
+
+class TextRankServer(ThreadingHTTPServer):
+    """
+    HTTP server backed by warm extractors in worker processes.
+
+    Args:
+        address: (host, port) to listen on
+        extractor: Extractor copied into every worker
+        workers: Number of worker processes; 0 runs extraction on a thread
+            of the server process instead
+        batch_window: Seconds a batch stays open for more requests
+        max_batch: Maximum number of requests per batch
+        request_timeout: Seconds a request may wait for its result
+        max_body_bytes: Largest accepted request body
+        verbose: Log every request to stderr
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        extractor: Optional[TextRankKeywordExtractor] = None,
+        workers: Optional[int] = 1,
+        batch_window: float = 0.005,
+        max_batch: int = 32,
+        request_timeout: float = 60.0,
+        max_body_bytes: int = 10 << 20,
+        verbose: bool = False
+    ):
+        super().__init__(address, _Handler)
+        extractor = extractor if extractor is not None else TextRankKeywordExtractor()
+        if workers == 0:
+            _warm_worker(extractor)
+            self.pool: Executor = ThreadPoolExecutor(1)
+            workers = 1
+        else:
+            workers = resolve_n_jobs(workers)
+            self.pool = ProcessPoolExecutor(workers, initializer=_warm_worker, initargs=(extractor,))
+        self.metrics = ServerMetrics()
+        # Two batches per worker keep the workers busy while the next batch fills
+        self.batcher = MicroBatcher(self.pool, batch_window, max_batch, 2 * workers, self.metrics)
+        self.request_timeout = request_timeout
+        self.max_body_bytes = max_body_bytes
+        self.verbose = verbose
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.batcher.close()
+        self.pool.shutdown(cancel_futures=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m text_rank.serve',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes (-1 for all CPUs, 0 to run in the server process)')
+    parser.add_argument('--batch-window-ms', type=float, default=5.0, help='How long a batch waits for more requests')
+    parser.add_argument('--max-batch', type=int, default=32, help='Maximum number of requests per batch')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Seconds a request may wait for its result')
+    parser.add_argument('--window-size', type=int, default=5, help='Co-occurrence window size')
+    parser.add_argument('--ranking', default='sparse', help="Ranking backend ('sparse' or 'networkx')")
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args(argv)
+
+    prepare()
+    extractor = TextRankKeywordExtractor(window_size=args.window_size, ranking=args.ranking)
+    server = TextRankServer(
+        (args.host, args.port), extractor, workers=args.workers, batch_window=args.batch_window_ms / 1000,
+        max_batch=args.max_batch, request_timeout=args.timeout, verbose=args.verbose
+    )
+    host, port = server.server_address[:2]
+    print(f"Serving TextRank on http://{host}:{port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""Extractive summarization with TextRank over a sparse sentence-similarity graph."""
+
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .cooccurrence import encode_words
+from .core import TextRankKeywordExtractor
+from .graph import WordGraph
+from .instrumentation import stage
+from .parallel import map_with_extractor
+from .ranking import top_k
+from .sentences import split_sentences
+
+
+def _summarize_task(summarizer: 'TextRankSummarizer', task: Tuple[str, Optional[int], bool]) -> List[Tuple[str, float]]:
+    text, top_n, in_order = task
+    return summarizer.summarize(text, top_n, in_order=in_order)
+
+
+class TextRankSummarizer:
+    """
+    Rank sentences with TextRank and return the most central ones.
+
+    Sentences are linked by the similarity from the TextRank paper: the number
+    of words they share divided by ``log |Si| + log |Sj|``. All pairwise
+    overlaps come from one sparse product of the sentence-by-word incidence
+    matrix with its transpose, so only sentence pairs that share a word are
+    ever touched.
+
+    Tokenizer, stopwords, ranking backend and its parameters, and the
+    observer are taken from ``extractor``. POS tagging is not used: every
+    alphanumeric token that is not a stopword counts as a word.
+
+    Args:
+        extractor: Extractor whose settings are shared. If None, defaults are used.
+    """
+
+    def __init__(self, extractor: Optional[TextRankKeywordExtractor] = None):
+        self.extractor = extractor if extractor is not None else TextRankKeywordExtractor()
+
+    def _sentence_words(self, sentences: List[str]) -> List[List[str]]:
+        tokenizer = self.extractor.tokenizer
+        stop_words = self.extractor.stop_words
+        words = []
+        for sentence in sentences:
+            lowered = [token.lower() for token in tokenizer.tokenize(sentence) if token.isalnum()]
+            words.append([token for token in lowered if token not in stop_words])
+        return words
+
+    def build_similarity_graph(self, sentences: List[str]) -> WordGraph:
+        """
+        Build the weighted sentence graph; node ``i`` is ``sentences[i]``.
+
+        Args:
+            sentences: Sentences of one document
+
+        Returns:
+            WordGraph: Graph labeled by sentence index
+        """
+        from scipy import sparse
+
+        observer = self.extractor.observer
+        with stage(observer, 'tokenize') as s:
+            sentence_words = self._sentence_words(sentences)
+            s.count(sentences=len(sentences))
+        with stage(observer, 'similarity') as s:
+            n = len(sentences)
+            lengths = np.array([len(words) for words in sentence_words], dtype=np.float64)
+            vocabulary, ids = encode_words(word for words in sentence_words for word in words)
+            rows = np.repeat(np.arange(n), lengths.astype(np.int64))
+            incidence = sparse.csr_matrix((np.ones(len(ids)), (rows, ids)), shape=(n, len(vocabulary)))
+            # Count each shared word once, however often it repeats in a sentence
+            incidence.sum_duplicates()
+            incidence.data[:] = 1.0
+            overlap = (incidence @ incidence.T).tocsr()
+
+            # The product is already symmetric, so its entries are scaled directly
+            log_lengths = np.log(np.maximum(lengths, 1.0))
+            rows = np.repeat(np.arange(n), np.diff(overlap.indptr))
+            denominators = log_lengths[rows] + log_lengths[overlap.indices]
+            # No self-loops, and two one-word sentences (zero denominator) stay unlinked
+            unlinked = (rows == overlap.indices) | (denominators <= 0)
+            overlap.data = np.where(unlinked, 0.0, overlap.data / np.where(unlinked, 1.0, denominators))
+            overlap.eliminate_zeros()
+            graph = WordGraph(range(n), overlap)
+            s.count(nodes=n, edges=overlap.nnz // 2)
+        return graph
+
+    def rank_sentences(self, text: str) -> Tuple[List[str], np.ndarray]:
+        """
+        Score every sentence of ``text``.
+
+        Returns:
+            Tuple of (sentences, scores) in document order
+        """
+        sentences = [sentence.strip() for sentence in split_sentences(text)]
+        graph = self.build_similarity_graph(sentences)
+        return sentences, self.extractor._rank(graph).scores
+
+    def summarize(self, text: str, top_n: Optional[int] = 3, in_order: bool = True) -> List[Tuple[str, float]]:
+        """
+        Extract the top-ranked sentences.
+
+        Args:
+            text: The input text to summarize
+            top_n: Number of sentences to return. If None, returns all sentences.
+            in_order: If True, the selected sentences are returned in document
+                order; otherwise by descending score
+
+        Returns:
+            List of tuples containing (sentence, score) pairs
+        """
+        sentences, scores = self.rank_sentences(text)
+        with stage(self.extractor.observer, 'select') as s:
+            order = top_k(scores, top_n)
+            if in_order:
+                order = np.sort(order)
+            summary = [(sentences[i], score) for i, score in zip(order.tolist(), scores[order].tolist())]
+            s.count(sentences=len(summary))
+        return summary
+
+    def summarize_batch(
+        self,
+        texts: Iterable[str],
+        top_n: Optional[int] = 3,
+        in_order: bool = True,
+        n_jobs: Optional[int] = 1,
+        chunksize: int = 1,
+        return_exceptions: bool = False
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Summarize many texts, optionally across worker processes.
+
+        Args:
+            texts: The input texts to summarize
+            top_n: Number of sentences to return per text. If None, returns all sentences.
+            in_order: If True, sentences are returned in document order
+            n_jobs: Number of worker processes. 1 runs in the current process;
+                None or -1 uses all CPUs.
+            chunksize: Number of texts sent to a worker at a time
+            return_exceptions: If True, a failing text yields its exception
+                instead of aborting the batch
+
+        Returns:
+            List with one summary per text, in input order
+        """
+        tasks = [(text, top_n, in_order) for text in texts]
+        return map_with_extractor(_summarize_task, tasks, self, n_jobs=n_jobs,
+                                  chunksize=chunksize, return_exceptions=return_exceptions)
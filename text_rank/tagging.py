@@ -0,0 +1,158 @@
+"""Part-of-speech tagging strategies and the candidate-decision cache."""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .resources import require
+
+TaggedTokens = List[Tuple[str, str]]
+
+
+class Tagger:
+    """
+    Base class for taggers used by ``TextRankKeywordExtractor``.
+
+    Subclasses implement ``tag``; ``tag_sents`` tags a batch of sentences and
+    can be overridden when the underlying tagger has a faster batch path.
+    """
+
+    def tag(self, tokens: Sequence[str]) -> TaggedTokens:
+        raise NotImplementedError
+
+    def tag_sents(self, sentences: Sequence[Sequence[str]]) -> List[TaggedTokens]:
+        return [self.tag(tokens) for tokens in sentences]
+
+
+class NLTKTagger(Tagger):
+    """NLTK's averaged perceptron tagger (the default)"""
+
+    def __init__(self, lang: str = 'eng'):
+        self.lang = lang
+
+    def tag(self, tokens):
+        require('averaged_perceptron_tagger_eng')
+        from nltk.tag import pos_tag
+
+        return pos_tag(tokens, lang=self.lang)
+
+    def tag_sents(self, sentences):
+        require('averaged_perceptron_tagger_eng')
+        from nltk.tag import pos_tag_sents
+
+        return pos_tag_sents(sentences, lang=self.lang)
+
+
+class CallableTagger(Tagger):
+    """
+    Adapt a ``pos_tag``-like callable to the ``Tagger`` interface.
+
+    Args:
+        func: Callable mapping a list of tokens to a list of (token, tag) pairs
+    """
+
+    def __init__(self, func: Callable[[Sequence[str]], TaggedTokens]):
+        self.func = func
+
+    def tag(self, tokens):
+        return self.func(tokens)
+
+
+def get_tagger(tagger) -> Tagger:
+    """Resolve ``None`` (NLTK), a ``Tagger`` instance or a tagging callable"""
+    if tagger is None:
+        return NLTKTagger()
+    if isinstance(tagger, Tagger):
+        return tagger
+    if callable(tagger):
+        return CallableTagger(tagger)
+    raise TypeError(f"tagger must be None, a Tagger or a callable, got {type(tagger).__name__}")
+
+
+class CacheInfo(NamedTuple):
+    """Token-level hit/miss counters of a ``CandidateCache``."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CandidateCache:
+    """
+    LRU cache of token -> is-candidate decisions.
+
+    A decision is reused regardless of the context the token appears in, so a
+    sentence whose tokens are all cached is not re-tagged. This trades a
+    little tagging accuracy for skipping repeated text such as boilerplate.
+
+    Keys are the token as it appears in the text: the tagger is case-sensitive
+    (e.g. a capitalized word is often tagged NNP), so lowercasing the key would
+    merge decisions the tagger keeps apart.
+
+    Lookups and updates are serialized with a lock, so one cache can back an
+    extractor that is shared between threads.
+
+    Args:
+        maxsize: Maximum number of tokens kept
+    """
+
+    def __init__(self, maxsize: int = 100000):
+        self.maxsize = maxsize
+        self._decisions: "OrderedDict[str, bool]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def lookup(self, tokens: Iterable[str]) -> Optional[List[bool]]:
+        """
+        Return cached decisions for every token, or None if any token is missing.
+
+        Every token is counted as a hit or a miss.
+        """
+        decisions = self._decisions
+        flags = []
+        complete = True
+        with self._lock:
+            for token in tokens:
+                flag = decisions.get(token)
+                if flag is None:
+                    self.misses += 1
+                    complete = False
+                else:
+                    self.hits += 1
+                    decisions.move_to_end(token)
+                    flags.append(flag)
+        return flags if complete else None
+
+    def update(self, tokens: Iterable[str], flags: Iterable[bool]) -> None:
+        """Store decisions, evicting the least recently used tokens when full"""
+        decisions = self._decisions
+        with self._lock:
+            for token, flag in zip(tokens, flags):
+                decisions[token] = flag
+                decisions.move_to_end(token)
+            while len(decisions) > self.maxsize:
+                decisions.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._decisions))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._decisions.clear()
+            self.hits = 0
+            self.misses = 0
@@ -1,8 +1,22 @@
 """Utility functions for text file handling."""
 
+import codecs
+import gzip
+import hashlib
+import io
+import json
 import os
-from typing import List, Tuple, Union, Dict, Optional
+import time
+from typing import IO, Callable, List, Tuple, Union, Dict, Optional, Iterator
 from .core import TextRankKeywordExtractor
+from .graph_io import read_pajek, write_pajek
+from .parallel import imap_with_extractor, map_with_extractor
+from .result_cache import ResultCache, file_hash
+
+# Written to the output directory of export_multiple_graphs_to_pajek
+MANIFEST_NAME = 'manifest.json'
+# Seconds between manifest checkpoints while separate files are exported
+MANIFEST_SAVE_INTERVAL = 1.0
 
 def read_text_file(file_path: str, encoding: str = 'utf-8') -> str:
     """
@@ -31,11 +45,53 @@ def read_text_file(file_path: str, encoding: str = 'utf-8') -> str:
     # This should never be reached, but just in case
     raise UnicodeDecodeError(f"Failed to decode {file_path} with any of the attempted encodings")
 
+def _detect_encoding(file_path: str, encodings: List[str], chunk_size: int) -> str:
+    """Return the first encoding that decodes the whole file, reading it in chunks"""
+    for enc in encodings:
+        decoder = codecs.getincrementaldecoder(enc)()
+        try:
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(chunk_size), b''):
+                    decoder.decode(block)
+                decoder.decode(b'', final=True)
+            return enc
+        except UnicodeDecodeError:
+            # If this is the last encoding to try, re-raise the exception
+            if enc == encodings[-1]:
+                raise
+    # This should never be reached, but just in case
+    raise ValueError(f"Failed to decode {file_path} with any of the attempted encodings")
+
+def iter_text_file(file_path: str, encoding: str = 'utf-8', chunk_size: int = 1 << 20) -> Iterator[str]:
+    """
+    Read text from a file in chunks.
+    
+    Uses the same encoding fallbacks as ``read_text_file``. The encoding is
+    checked in a separate pass before any text is yielded, so memory stays
+    bounded by ``chunk_size``.
+    
+    Args:
+        file_path: Path to the text file
+        encoding: File encoding (default: 'utf-8')
+        chunk_size: Number of bytes (first pass) or characters (second pass) read at a time
+        
+    Yields:
+        str: Consecutive pieces of the file content
+    """
+    encodings_to_try = [encoding, 'latin-1', 'cp1252', 'iso-8859-1']
+    enc = _detect_encoding(file_path, encodings_to_try, chunk_size)
+    with open(file_path, 'r', encoding=enc) as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            yield chunk
+
 def analyze_text_file(
     file_path: str,
     top_n: Optional[int] = None,
     window_size: int = 5,
-    encoding: str = 'utf-8'
+    encoding: str = 'utf-8',
+    extractor: Optional[TextRankKeywordExtractor] = None,
+    streaming: bool = False,
+    cache: Optional[ResultCache] = None
 ) -> List[Tuple[str, float]]:
     """
     Analyze a text file and extract keywords.
@@ -45,58 +101,338 @@ def analyze_text_file(
         top_n: Number of top keywords to return. If None, returns all keywords.
         window_size: Size of the sliding window for co-occurrence
         encoding: File encoding (default: 'utf-8')
+        extractor: Extractor to reuse. If None, one is built with ``window_size``.
+        streaming: If True, read and process the file in chunks with
+            ``extract_keywords_stream`` instead of loading it into memory
+        cache: Result cache for a newly built extractor. Ignored when
+            ``extractor`` is given; its own ``result_cache`` is used instead.
         
     Returns:
         List of tuples containing (word, score) pairs, sorted by score in descending order
     """
+    if extractor is None:
+        extractor = TextRankKeywordExtractor(window_size=window_size, result_cache=cache)
+    if streaming:
+        cache = extractor.result_cache
+        if cache is None:
+            return extractor.extract_keywords_stream(iter_text_file(file_path, encoding), top_n)
+        # Keyed on the raw bytes, so a cached file is not decoded at all
+        key = extractor.result_key(file_hash(file_path), top_n, mode=f'stream:{encoding}')
+        keywords = cache.get(key)
+        if keywords is None:
+            keywords = extractor.extract_keywords_stream(iter_text_file(file_path, encoding), top_n)
+            cache.put(key, keywords)
+        return keywords
     text = read_text_file(file_path, encoding)
-    extractor = TextRankKeywordExtractor(window_size=window_size)
     return extractor.extract_keywords(text, top_n)
 
+def _analyze_file_task(extractor: TextRankKeywordExtractor, task: Tuple[str, Optional[int], str]) -> List[Tuple[str, float]]:
+    file_path, top_n, encoding = task
+    return analyze_text_file(file_path, top_n=top_n, encoding=encoding, extractor=extractor)
+
 def analyze_multiple_files(
     file_paths: List[str],
     top_n: Optional[int] = None,
     window_size: int = 5,
-    encoding: str = 'utf-8'
+    encoding: str = 'utf-8',
+    n_jobs: Optional[int] = 1,
+    chunksize: int = 1,
+    errors: Optional[Dict[str, Exception]] = None,
+    cache: Optional[ResultCache] = None
 ) -> Dict[str, List[Tuple[str, float]]]:
     """
     Analyze multiple text files and extract keywords from each.
     
+    A single extractor is built and shared: in-process when ``n_jobs`` is 1,
+    otherwise one copy per worker process.
+    
     Args:
         file_paths: List of paths to text files
         top_n: Number of top keywords to return per file. If None, returns all keywords.
         window_size: Size of the sliding window for co-occurrence
         encoding: File encoding (default: 'utf-8')
+        n_jobs: Number of worker processes. 1 runs in the current process;
+            None or -1 uses all CPUs.
+        chunksize: Number of files sent to a worker at a time
+        errors: If given, files that fail are left out of the result and their
+            exception is stored here under the file path. If None, the first
+            failure is raised.
+        cache: Result cache for repeated files. Worker processes each get a
+            copy of its memory tier but share its on-disk tier.
         
     Returns:
-        Dictionary mapping file paths to their keyword lists
+        Dictionary mapping file paths to their keyword lists, in input order
     """
+    extractor = TextRankKeywordExtractor(window_size=window_size, result_cache=cache)
+    tasks = [(file_path, top_n, encoding) for file_path in file_paths]
+    outcomes = map_with_extractor(
+        _analyze_file_task,
+        tasks,
+        extractor,
+        n_jobs=n_jobs,
+        chunksize=chunksize,
+        return_exceptions=errors is not None
+    )
+    
     results = {}
-    for file_path in file_paths:
-        results[file_path] = analyze_text_file(
-            file_path,
-            top_n=top_n,
-            window_size=window_size,
-            encoding=encoding
-        )
+    for file_path, outcome in zip(file_paths, outcomes):
+        if isinstance(outcome, Exception):
+            errors[file_path] = outcome
+        else:
+            results[file_path] = outcome
+    return results
+
+def analyze_pajek_file(
+    file_path: str,
+    top_n: Optional[int] = None,
+    encoding: Optional[str] = None,
+    extractor: Optional[TextRankKeywordExtractor] = None
+) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    Rank the graphs stored in a Pajek file without re-processing any text.
+    
+    Args:
+        file_path: Path to a ``.net`` (or ``.net.gz``) file, e.g. one written by
+            ``export_multiple_graphs_to_pajek``
+        top_n: Number of top keywords to return per graph. If None, returns all keywords.
+        encoding: File encoding
+        extractor: Extractor whose ranking settings are used. If None, defaults are used.
+        
+    Returns:
+        Dictionary mapping network names (the file path for unnamed graphs) to keyword lists
+    """
+    if extractor is None:
+        extractor = TextRankKeywordExtractor()
+    results = {}
+    for name, graph in read_pajek(file_path, encoding=encoding):
+        results[name if name is not None else file_path] = extractor.extract_keywords_from_graph(graph, top_n)
     return results
 
+def _open_binary(path: str, mode: str):
+    return gzip.open(path, mode) if path.endswith('.gz') else open(path, mode)
+
+def _partial_path(path: str) -> str:
+    """Temporary name in the same directory that keeps the ``.gz`` suffix"""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".partial-{name}")
+
+def _pajek_block_task(extractor: TextRankKeywordExtractor, task: Tuple[str, str, str]) -> bytes:
+    file_path, encoding, network_name = task
+    text = read_text_file(file_path, encoding)
+    buffer = io.StringIO()
+    write_pajek(extractor.build_word_graph(text), buffer, network_name=network_name)
+    return buffer.getvalue().encode(encoding)
+
+def _pajek_file_task(extractor: TextRankKeywordExtractor, task: Tuple[str, str, str]) -> int:
+    file_path, encoding, pajek_path = task
+    text = read_text_file(file_path, encoding)
+    # Written under a temporary name so an interrupted run never leaves a truncated output
+    partial_path = _partial_path(pajek_path)
+    extractor.export_pajek(extractor.build_word_graph(text), partial_path)
+    os.replace(partial_path, pajek_path)
+    return os.path.getsize(pajek_path)
+
+def _load_manifest(manifest_path: str, settings: dict) -> Dict[str, dict]:
+    """Entries of an existing manifest, or none if it is missing or was written with other settings"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('settings') != settings:
+        return {}
+    return manifest.get('entries', {})
+
+def _save_manifest(manifest_path: str, settings: dict, entries: Dict[str, dict]) -> None:
+    partial_path = _partial_path(manifest_path)
+    with open(partial_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'settings': settings, 'entries': entries}, f, indent=2)
+    os.replace(partial_path, manifest_path)
+
+def _failed_entry(digest: Optional[str], error: Exception) -> dict:
+    return {'sha256': digest, 'output': None, 'size': None, 'status': 'error',
+            'error': f"{type(error).__name__}: {error}"}
+
+def _export_combined(
+    extractor: TextRankKeywordExtractor,
+    digests: Dict[str, str],
+    combined_path: str,
+    encoding: str,
+    previous: Dict[str, dict],
+    entries: Dict[str, dict],
+    failures: Dict[str, Exception],
+    save: Callable[[], None],
+    n_jobs: Optional[int],
+    chunksize: int
+) -> None:
+    """
+    Write all graphs to one file in input order, copying unchanged blocks from a previous output.
+
+    Blocks can be copied from the previous combined file or from the partial
+    file left behind by an interrupted run. The partial file is checkpointed
+    in the manifest like separate outputs are. Every copied block is checked
+    against its recorded SHA-256 and rebuilt if it does not match.
+    """
+    partial_path = _partial_path(combined_path)
+    # Moved aside so the blocks of an interrupted run can be read while the new partial file is written
+    resume_path = os.path.join(os.path.dirname(combined_path), f".resume-{os.path.basename(combined_path)}")
+    if os.path.exists(partial_path):
+        os.replace(partial_path, resume_path)
+    sources = {combined_path: combined_path, partial_path: resume_path}
+
+    def source(file_path):
+        entry = previous.get(file_path)
+        if (entry is None or entry['status'] != 'ok' or entry['sha256'] != digests[file_path]
+                or 'block_sha256' not in entry):
+            return None
+        path = sources.get(entry['output'])
+        return path if path is not None and os.path.exists(path) else None
+
+    # Decided once: the block stream holds exactly the inputs that are not copied
+    file_paths = list(digests)
+    reuse = {file_path: source(file_path) for file_path in file_paths}
+    tasks = [(file_path, encoding, os.path.basename(file_path)) for file_path in file_paths if reuse[file_path] is None]
+    blocks = imap_with_extractor(_pajek_block_task, tasks, extractor, n_jobs=n_jobs,
+                                 chunksize=chunksize, return_exceptions=True)
+
+    old_files = {}
+    last_save = time.monotonic()
+    try:
+        with _open_binary(partial_path, 'wb') as out:
+            offset = 0
+            for file_path in file_paths:
+                path = reuse[file_path]
+                if path is None:
+                    # Blocks arrive in input order, so the combined file is written sequentially
+                    block = next(blocks)
+                else:
+                    block = _copy_block(old_files, path, previous[file_path])
+                    if block is None:
+                        try:
+                            block = _pajek_block_task(extractor, (file_path, encoding, os.path.basename(file_path)))
+                        except Exception as e:
+                            block = e
+                if isinstance(block, Exception):
+                    entries[file_path] = _failed_entry(digests[file_path], block)
+                    failures[file_path] = block
+                    continue
+                out.write(block)
+                entries[file_path] = {'sha256': digests[file_path], 'output': partial_path,
+                                      'size': len(block), 'status': 'ok', 'offset': offset,
+                                      'block_sha256': hashlib.sha256(block).hexdigest()}
+                offset += len(block)
+                # Checkpoint the manifest so an interrupted run can resume from the partial file
+                if time.monotonic() - last_save >= MANIFEST_SAVE_INTERVAL:
+                    out.flush()
+                    save()
+                    last_save = time.monotonic()
+    finally:
+        for f in old_files.values():
+            f.close()
+    os.replace(partial_path, combined_path)
+    for entry in entries.values():
+        if entry['output'] == partial_path:
+            entry['output'] = combined_path
+    if os.path.exists(resume_path):
+        os.remove(resume_path)
+
+def _copy_block(old_files: Dict[str, IO[bytes]], path: str, entry: dict) -> Optional[bytes]:
+    """Read a previously written block, or None if it is missing or no longer matches its hash"""
+    try:
+        f = old_files.get(path)
+        if f is None:
+            f = old_files[path] = _open_binary(path, 'rb')
+        f.seek(entry['offset'])
+        block = f.read(entry['size'])
+    except (OSError, EOFError):
+        return None
+    if len(block) != entry['size'] or hashlib.sha256(block).hexdigest() != entry['block_sha256']:
+        return None
+    return block
+
+def _export_separate(
+    extractor: TextRankKeywordExtractor,
+    digests: Dict[str, str],
+    output_dir: str,
+    extension: str,
+    encoding: str,
+    previous: Dict[str, dict],
+    entries: Dict[str, dict],
+    failures: Dict[str, Exception],
+    save: Callable[[], None],
+    n_jobs: Optional[int],
+    chunksize: int
+) -> None:
+    """Write one file per graph, skipping outputs whose manifest entry is still valid"""
+    tasks = []
+    for file_path, digest in digests.items():
+        name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+        pajek_path = os.path.join(output_dir, f"{name_without_ext}{extension}")
+        entry = previous.get(file_path)
+        if (entry is not None and entry['status'] == 'ok' and entry['sha256'] == digest
+                and entry['output'] == pajek_path and os.path.isfile(pajek_path)
+                and os.path.getsize(pajek_path) == entry['size']):
+            entries[file_path] = entry
+        else:
+            tasks.append((file_path, encoding, pajek_path))
+
+    last_save = time.monotonic()
+    outcomes = imap_with_extractor(_pajek_file_task, tasks, extractor, n_jobs=n_jobs,
+                                   chunksize=chunksize, return_exceptions=True)
+    for (file_path, _, pajek_path), outcome in zip(tasks, outcomes):
+        if isinstance(outcome, Exception):
+            entries[file_path] = _failed_entry(digests[file_path], outcome)
+            failures[file_path] = outcome
+        else:
+            entries[file_path] = {'sha256': digests[file_path], 'output': pajek_path,
+                                  'size': outcome, 'status': 'ok'}
+        # Checkpoint the manifest so an interrupted run can resume
+        if time.monotonic() - last_save >= MANIFEST_SAVE_INTERVAL:
+            save()
+            last_save = time.monotonic()
+
 def export_multiple_graphs_to_pajek(
     file_paths: List[str],
     output_dir: str,
     window_size: int = 5,
     encoding: str = 'utf-8',
-    single_file: bool = False
+    single_file: bool = False,
+    compress: bool = False,
+    n_jobs: Optional[int] = 1,
+    chunksize: int = 1,
+    resume: bool = False,
+    errors: Optional[Dict[str, Exception]] = None
 ) -> Dict[str, str]:
     """
     Process multiple text files and export their co-occurrence graphs to Pajek format.
     
+    Graphs are built in worker processes. A file that fails is recorded and
+    skipped without affecting the others. In ``single_file`` mode, graphs
+    are still written in input order.
+    
+    Every run writes ``manifest.json`` to ``output_dir``. For each input it
+    records the SHA-256 of its content, the output path and size in bytes,
+    and the status ('ok' or 'error' with a message). In ``single_file`` mode
+    it also records the graph's byte offset within the combined file (before
+    compression) and the block's SHA-256. The manifest is checkpointed while
+    the export runs. With ``resume``, inputs whose content and output match
+    their manifest entry are not processed again: separate files are left in
+    place, and their blocks are copied from the previous combined file, or
+    from the partial file of an interrupted run.
+    
     Args:
         file_paths: List of paths to text files
         output_dir: Directory where the Pajek files will be saved
         window_size: Size of the sliding window for co-occurrence
         encoding: File encoding (default: 'utf-8')
         single_file: If True, export all graphs to a single file with separators
+        compress: If True, write gzip-compressed ``.net.gz`` files
+        n_jobs: Number of worker processes. 1 runs in the current process;
+            None or -1 uses all CPUs.
+        chunksize: Number of files sent to a worker at a time
+        resume: Skip inputs whose manifest entry from a previous run is still valid
+        errors: If given, the exception of every failed input is stored here
+            under its file path
         
     Returns:
         Dictionary mapping input file paths to their corresponding Pajek file paths
@@ -106,71 +442,51 @@ def export_multiple_graphs_to_pajek(
     
     # Initialize the extractor
     extractor = TextRankKeywordExtractor(window_size=window_size)
+    extension = ".net.gz" if compress else ".net"
+    
+    # A manifest written with different settings describes different outputs
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    settings = json.loads(json.dumps({
+        'encoding': encoding,
+        'single_file': single_file,
+        'compress': compress,
+        'extractor': extractor._cache_config(),
+    }))
+    previous = _load_manifest(manifest_path, settings) if resume else {}
+    entries: Dict[str, dict] = {}
+    failures: Dict[str, Exception] = {}
+    
+    digests = {}
+    for file_path in file_paths:
+        try:
+            digests[file_path] = file_hash(file_path)
+        except OSError as e:
+            entries[file_path] = _failed_entry(None, e)
+            failures[file_path] = e
     
-    # Process each file
-    result = {}
+    def save():
+        _save_manifest(manifest_path, settings, {path: entries[path] for path in file_paths if path in entries})
     
     if single_file:
-        # Export all graphs to a single file
-        combined_path = os.path.join(output_dir, "combined_graphs.net")
-        
+        combined_path = os.path.join(output_dir, f"combined_graphs{extension}")
         try:
-            with open(combined_path, 'w', encoding=encoding) as combined_file:
-                for i, file_path in enumerate(file_paths):
-                    try:
-                        # Read the text file
-                        text = read_text_file(file_path, encoding)
-                        
-                        # Build the co-occurrence graph
-                        graph = extractor.build_cooccurrence_graph(text)
-                        
-                        # Add a separator with the filename
-                        base_name = os.path.basename(file_path)
-                        combined_file.write(f"\n*Network {base_name}\n")
-                        
-                        # Write vertices
-                        combined_file.write(f"*Vertices {len(graph.nodes())}\n")
-                        for j, node in enumerate(graph.nodes(), 1):
-                            combined_file.write(f'{j} "{node}"\n')
-                        
-                        # Write edges
-                        combined_file.write("*Edges\n")
-                        for u, v, data in graph.edges(data=True):
-                            combined_file.write(f"{list(graph.nodes()).index(u)+1} {list(graph.nodes()).index(v)+1} {data['weight']}\n")
-                        
-                        # Store the mapping (all files map to the same combined file)
-                        result[file_path] = combined_path
-                    except Exception as e:
-                        print(f"Warning: Could not process file {file_path}: {str(e)}")
-                        continue
-        except Exception as e:
-            print(f"Error writing combined file: {str(e)}")
+            _export_combined(extractor, digests, combined_path, encoding, previous, entries,
+                             failures, save, n_jobs, chunksize)
+        except OSError:
             # Fall back to writing individual files
+            for file_path in digests:
+                entries.pop(file_path, None)
+                failures.pop(file_path, None)
             single_file = False
-            print("Falling back to writing individual files...")
+            settings['single_file'] = False
+            previous = _load_manifest(manifest_path, settings) if resume else {}
     
     if not single_file:
-        # Export each graph to a separate file
-        for file_path in file_paths:
-            try:
-                # Read the text file
-                text = read_text_file(file_path, encoding)
-                
-                # Build the co-occurrence graph
-                graph = extractor.build_cooccurrence_graph(text)
-                
-                # Generate output filename based on input filename
-                base_name = os.path.basename(file_path)
-                name_without_ext = os.path.splitext(base_name)[0]
-                pajek_path = os.path.join(output_dir, f"{name_without_ext}.net")
-                
-                # Export the graph to Pajek format
-                extractor.export_pajek(graph, pajek_path)
-                
-                # Store the mapping
-                result[file_path] = pajek_path
-            except Exception as e:
-                print(f"Warning: Could not process file {file_path}: {str(e)}")
-                continue
-    
-    return result 
\ No newline at end of file
+        _export_separate(extractor, digests, output_dir, extension, encoding, previous, entries,
+                         failures, save, n_jobs, chunksize)
+    
+    save()
+    if errors is not None:
+        errors.update(failures)
+    return {path: entries[path]['output'] for path in file_paths
+            if path in entries and entries[path]['status'] == 'ok'}
@@ -0,0 +1,210 @@
+"""Corpus-level word interning shared across documents and extractors."""
+
+import os
+import threading
+from itertools import repeat
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .cooccurrence import encode_words
+from .graph_io import PackedVocabulary
+
+# encode_document numbers nodes through a dense scratch array when the
+# vocabulary has at most this many words per candidate, otherwise by sorting
+DENSE_NUMBERING_RATIO = 64
+
+
+class Vocabulary(Sequence):
+    """
+    Map words to stable int32 ids, shared across documents.
+
+    An extractor given a vocabulary looks every document up in it, so graph
+    nodes carry corpus ids. Sharing one instance between extractors (or
+    saving it and loading it elsewhere) gives the same word the same id
+    everywhere, e.g. in ``KeywordArrays.ids``.
+
+    Extraction never adds words: words are only added by ``encode`` (or by
+    ``DocumentFrequencyIndex.add_document``), so a long-running extractor
+    does not grow the vocabulary. Words it does not contain get id -1. Since
+    worker processes never add words either, ids from a parallel batch are
+    the parent's ids. Words can be added from several threads.
+
+    Args:
+        words: Initial words, assigned ids in order
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._index: Dict[str, int] = {}
+        self._words: List[str] = []
+        self._lock = threading.Lock()
+        self.encode(words)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __getitem__(self, i):
+        return self._words[i]
+
+    def __iter__(self):
+        return iter(self._words)
+
+    def __contains__(self, word) -> bool:
+        return word in self._index
+
+    def get_id(self, word: str) -> Optional[int]:
+        """Id of ``word``, or None if it has not been seen"""
+        return self._index.get(word)
+
+    def add(self, word: str) -> int:
+        """Return the id of ``word``, assigning the next free id if it is new"""
+        return int(self.encode([word])[0])
+
+    def encode(self, words: Iterable[str]) -> np.ndarray:
+        """
+        Encode words as int32 ids, adding unknown words to the vocabulary.
+
+        Args:
+            words: Words to encode
+
+        Returns:
+            np.ndarray: One id per word
+        """
+        if not isinstance(words, list):
+            words = list(words)
+        try:
+            return np.fromiter(map(self._index.__getitem__, words), dtype=np.int32, count=len(words))
+        except KeyError:
+            pass
+        with self._lock:
+            index = self._index
+            ids = []
+            for word in words:
+                word_id = index.get(word)
+                if word_id is None:
+                    word_id = index[word] = len(self._words)
+                    self._words.append(word)
+                ids.append(word_id)
+        return np.array(ids, dtype=np.int32)
+
+    def lookup(self, words: Iterable[str]) -> np.ndarray:
+        """Ids of words as int32, -1 for words not in the vocabulary; nothing is added"""
+        if not isinstance(words, list):
+            words = list(words)
+        return np.fromiter(map(self._index.get, words, repeat(-1)), dtype=np.int32, count=len(words))
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """Return the words for a sequence of ids"""
+        words = self._words
+        return [words[i] for i in np.asarray(ids).tolist()]
+
+    def encode_document(self, words: Iterable[str]) -> Tuple['VocabularyView', np.ndarray]:
+        """
+        Encode one document for graph construction, without adding its words.
+
+        Returns:
+            Tuple of (nodes, ids): the document's distinct words as a
+            ``VocabularyView`` in order of first occurrence, and the position
+            of every word among those nodes. Node positions are local to the
+            document, so words the vocabulary does not contain are still
+            nodes; their vocabulary id is -1.
+        """
+        if not isinstance(words, list):
+            words = list(words)
+        # Every id found by the lookup is below n_words, so unknown words are keyed past it
+        n_words = len(self._words)
+        keys = self.lookup(words).astype(np.int64)
+        unknown = keys < 0
+        unknown_words: List[str] = []
+        if unknown.any():
+            unknown_words, unknown_ids = encode_words(word for word, flag in zip(words, unknown.tolist()) if flag)
+            keys[unknown] = n_words + unknown_ids
+        node_keys, positions = _number_by_first_occurrence(keys, n_words + len(unknown_words))
+        ids = np.where(node_keys < n_words, node_keys, -1).astype(np.int32)
+        unknown_nodes = {int(node): unknown_words[int(node_keys[node]) - n_words]
+                         for node in np.flatnonzero(ids < 0).tolist()}
+        return VocabularyView(self, ids, unknown_nodes), positions
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the vocabulary (ids are the word order) to ``path``"""
+        packed = PackedVocabulary.from_words(self._words)
+        with open(path, 'wb') as f:
+            np.savez(f, offsets=packed.offsets, data=packed.data)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> 'Vocabulary':
+        """Read a vocabulary written by ``save``"""
+        with np.load(path) as arrays:
+            return cls(PackedVocabulary(arrays['offsets'], arrays['data']))
+
+
+def _number_by_first_occurrence(keys: np.ndarray, n_keys: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Number the distinct values of ``keys`` (all below ``n_keys``) in order of first occurrence.
+
+    Returns:
+        Tuple of (distinct, positions) where ``distinct[positions[i]] == keys[i]``
+    """
+    n = len(keys)
+    if n_keys <= DENSE_NUMBERING_RATIO * n:
+        # One scratch slot per key: no sort, and cheap while the vocabulary is not much larger than the text
+        slots = np.full(n_keys, n, dtype=np.int64)
+        np.minimum.at(slots, keys, np.arange(n))
+        starts = np.flatnonzero(slots[keys] == np.arange(n))
+        distinct = keys[starts]
+        slots[distinct] = np.arange(len(starts))
+        return distinct, slots[keys].astype(np.int32)
+    distinct, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind='stable')
+    positions = np.empty(len(order), dtype=np.int32)
+    positions[order] = np.arange(len(order), dtype=np.int32)
+    return distinct[order], positions[inverse.ravel()]
+
+
+class VocabularyView(Sequence):
+    """
+    Node labels of one graph together with their ids in a shared ``Vocabulary``.
+
+    ``ids[i]`` is the vocabulary id of node ``i``, or -1 if the vocabulary
+    does not contain its word. Only the words of those -1 nodes are stored;
+    the others are read from the vocabulary when a label is needed.
+    """
+
+    def __init__(self, vocabulary: Vocabulary, ids: np.ndarray, unknown: Dict[int, str]):
+        self.vocabulary = vocabulary
+        self.ids = ids
+        # Node position -> word, for nodes with id -1
+        self.unknown = unknown
+
+    def subset(self, nodes: np.ndarray) -> 'VocabularyView':
+        """View of the given node positions, in that order"""
+        unknown = self.unknown
+        if unknown:
+            unknown = {i: unknown[node] for i, node in enumerate(nodes.tolist()) if node in unknown}
+        return VocabularyView(self.vocabulary, self.ids[nodes], unknown)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        word_id = int(self.ids[i])
+        if word_id < 0:
+            return self.unknown[i % len(self)]
+        return self.vocabulary[word_id]
+
+    def __iter__(self):
+        if self.unknown:
+            return (self[i] for i in range(len(self)))
+        return iter(self.vocabulary.decode(self.ids))